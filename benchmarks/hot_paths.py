@@ -0,0 +1,164 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.transformer import TimestampTransformer
+from rtsdatetime.units import GeneratedRSTUnit, RTSTimeUnits
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+TIMESTAMP = 1_700_000_000.5
+
+
+def _event_class(units: type[RTSTimeUnits]) -> type[RTSDateTime]:
+    class Event(RTSDateTime):
+        start = Timestamp()
+        end = Timestamp()
+        shifted = TimestampTransformer(start, lambda timestamp: timestamp + 3600)
+        clock = TimeComponent(units, start)
+        shifted_clock = TimeComponent(units, shifted)
+
+    Event.__name__ = f"{units.__name__}Event"
+    return Event
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    benchmarks: dict[str, Callable[[], object]] = {}
+    for units in (RSTUnits, RSTStandardUnits, StandardUnits):
+        name = units.__name__
+        schema = units._schema
+        event_cls = _event_class(units)
+        event = event_cls(start=TIMESTAMP, end=TIMESTAMP + 60)
+        rts_timestamp = f"start={TIMESTAMP},end={TIMESTAMP + 60}"
+        schema_json = event_cls.dump_json()
+        length, wrap = schema.lengths[1], schema.wraps[1]
+        unit_timestamp = units.from_utc_timestamp(TIMESTAMP).timestamp
+
+        benchmarks.update(
+            {
+                f"{name}.from_utc_timestamp": lambda units=units: units.from_utc_timestamp(TIMESTAMP),
+                f"{name}.units": lambda units=units, unit_timestamp=unit_timestamp: list(
+                    units.from_timestamp(unit_timestamp).units.values()
+                ),
+                f"{name}.visual_unit": lambda unit_timestamp=unit_timestamp, length=length, wrap=wrap: GeneratedRSTUnit(
+                    unit_timestamp, length, wrap
+                ).visual_unit,
+                f"{name}.construct": lambda event_cls=event_cls: event_cls(start=TIMESTAMP, end=TIMESTAMP + 60),
+                f"{name}.str": lambda event=event: str(event),
+                f"{name}.rst_timestamp": lambda event=event: event.rst_timestamp(),
+                f"{name}.from_rts_timestamp": lambda event_cls=event_cls, rts_timestamp=rts_timestamp: event_cls.from_rts_timestamp(
+                    rts_timestamp
+                ),
+                f"{name}.dump_json": lambda event_cls=event_cls: event_cls.dump_json(),
+                f"{name}.load_json": lambda schema_json=schema_json: RTSDateTime.load_json(schema_json),
+                f"{name}.transformer_read": lambda event=event: event.shifted,
+                f"{name}.transformer_fresh": lambda event_cls=event_cls: event_cls(start=TIMESTAMP).shifted,
+            }
+        )
+    return benchmarks
+
+
+def measure_throughput(func: Callable[[], object], min_time: float, repeat: int) -> float:
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def measure_allocations(func: Callable[[], object], samples: int = 200) -> float:
+    func()
+    tracemalloc.start()
+    total = 0
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func()
+        total += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return total / samples
+
+
+def run(selected: list[str] | None, min_time: float, repeat: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for name, func in cases().items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        results[name] = {
+            "ops_per_sec": round(measure_throughput(func, min_time, repeat), 1),
+            "peak_bytes": round(measure_allocations(func), 1),
+        }
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    max_slowdown: float,
+    max_alloc_growth: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result["ops_per_sec"] < expected["ops_per_sec"] * (1 - max_slowdown):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:.0f} ops/s is more than {max_slowdown:.0%} below "
+                f"baseline {expected['ops_per_sec']:.0f} ops/s"
+            )
+        if result["peak_bytes"] > expected["peak_bytes"] * (1 + max_alloc_growth) + 64:
+            regressions.append(
+                f"{name}: {result['peak_bytes']:.0f} peak bytes is more than {max_alloc_growth:.0%} above "
+                f"baseline {expected['peak_bytes']:.0f} bytes"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the rtsdatetime hot paths")
+    parser.add_argument("filter", nargs="*", help="only run benchmarks whose name contains one of these strings")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--max-slowdown", type=float, default=0.3, help="allowed throughput drop (fraction)")
+    parser.add_argument("--max-alloc-growth", type=float, default=0.2, help="allowed peak allocation growth (fraction)")
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.filter, args.min_time, args.repeat)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    for name, result in results.items():
+        expected = baseline.get(name)
+        ratio = f"{result['ops_per_sec'] / expected['ops_per_sec']:6.2f}x" if expected else "     -"
+        print(f"{name:<36} {result['ops_per_sec']:>14,.0f} ops/s {ratio} {result['peak_bytes']:>10,.0f} B/op")
+
+    if args.update:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    regressions = compare(results, baseline, args.max_slowdown, args.max_alloc_growth)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("base64", "dataclasses", "secrets", "tempfile", "rtsdatetime.default_units", "numpy")
+
+
+def measure(statement: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the rtsdatetime import time")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=75.0, help="allowed import cost over bare python (ms)")
+    args = parser.parse_args()
+
+    measure("import rtsdatetime")
+    baseline = statistics.median(measure("pass") for _ in range(args.repeat))
+    imported = statistics.median(measure("import rtsdatetime") for _ in range(args.repeat))
+    cost = (imported - baseline) * 1000
+    print(f"python startup {baseline * 1000:8.2f} ms")
+    print(f"import cost    {cost:8.2f} ms (budget {args.budget:.2f} ms)")
+
+    check = f"import sys, rtsdatetime; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    loaded = subprocess.run([sys.executable, "-c", check], check=True, capture_output=True, text=True).stdout.strip()
+    if loaded:
+        print(f"eagerly imported: {loaded}")
+    return 1 if cost > args.budget or loaded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
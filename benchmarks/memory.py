@@ -0,0 +1,58 @@
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, RTSTimeDelta, TimeComponent, Timestamp
+from rtsdatetime.units import GeneratedRSTUnit, RTSTimeUnits, RTSUnit
+
+
+class SlottedRSTUnits(RTSTimeUnits, slots=True):
+    beat: RTSUnit = RTSUnit(1, 40)
+    decitap: RTSUnit = RTSUnit(40, 10)
+    tap: RTSUnit = RTSUnit(400, 6)
+    hexa: RTSUnit = RTSUnit(2400, 8)
+    octa: RTSUnit = RTSUnit(19200, 6)
+    day: RTSUnit = RTSUnit(115200, 0)
+    seconds_ratio = RSTUnits.seconds_ratio
+    epoch = RSTUnits.epoch
+
+
+class Event(RTSDateTime, slots=True):
+    start = Timestamp()
+    end = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+CASES: dict[str, Callable[[int], object]] = {
+    "GeneratedRSTUnit": lambda index: GeneratedRSTUnit(index + 0.5, 40, 10),
+    "RTSTimeDelta": lambda index: RTSTimeDelta(index, RSTUnits),
+    "RSTUnits": lambda index: RSTUnits.from_timestamp(index + 0.5),
+    "RSTUnits(slots=True)": lambda index: SlottedRSTUnits.from_timestamp(index + 0.5),
+    "RTSDateTime(2 timestamps)": lambda index: Event(start=index + 0.5, end=index + 1.5),
+}
+
+
+def bytes_per_instance(factory: Callable[[int], object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = instances.__sizeof__()
+    del instances
+    return (after - before - list_overhead) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-instance memory of the core rtsdatetime types")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    for name, factory in CASES.items():
+        print(f"{name:<28} {bytes_per_instance(factory, args.count):8.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
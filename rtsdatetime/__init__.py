@@ -1,8 +1,34 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .model import TimeComponent, RTSDateTime, RTSTimeDelta
 
+if TYPE_CHECKING:
+    from . import default_units, transformer  # noqa: F401 - re-exported lazily by __getattr__
+    from .array import RTSDateTimeArray
+
+_lazy_modules = {"default_units", "transformer", "registry", "units"}
+_lazy_attributes = {"RTSDateTimeArray": ".array"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_modules:
+        return importlib.import_module(f".{name}", __name__)
+    module = _lazy_attributes.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_modules, *_lazy_attributes})
+
 
 __all__ = [
     "RTSDateTime",
+    "RTSDateTimeArray",
     "TimeComponent",
     "RTSTimeDelta",
 ]
@@ -0,0 +1,98 @@
+import numbers
+import operator
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .model import RTSDateTime, Timestamp
+from .vectorized import UnitArrays, _numpy, decompose
+
+
+class RTSDateTimeArray[T: RTSDateTime]:
+    def __init__(self, datetime_cls: type[T], columns: dict[str, Any]):
+        np = _numpy()
+        settable = datetime_cls._schema.settable
+        for name in columns:
+            if name not in datetime_cls._schema.settable_set:
+                raise ValueError(f"Unknown timestamp '{name}'")
+        arrays = {name: np.asarray(columns[name]) for name in settable if name in columns}
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("RTSDateTimeArray columns must all have the same length")
+        length = lengths.pop() if lengths else 0
+        self._datetime_cls = datetime_cls
+        self._columns: dict[str, Any] = {}
+        for name in settable:
+            array = arrays.get(name)
+            if array is None:
+                array = np.zeros(length, dtype=np.float64)
+            elif array.ndim != 1:
+                raise ValueError(f"column '{name}' must be 1-D, got {array.ndim} dimensions")
+            dtype = np.int64 if np.issubdtype(array.dtype, np.integer) else np.float64
+            self._columns[name] = np.ascontiguousarray(array, dtype=dtype)
+        self._length = length
+
+    @classmethod
+    def from_objects(cls, datetime_cls: type[T], objects: Iterable[T]) -> "RTSDateTimeArray[T]":
+        np = _numpy()
+        objects = list(objects)
+        columns = {
+            name: np.fromiter((getattr(obj, name) for obj in objects), dtype=np.float64, count=len(objects))
+            for name in datetime_cls._schema.settable
+        }
+        return cls(datetime_cls, columns)
+
+    @property
+    def datetime_cls(self) -> type[T]:
+        return self._datetime_cls
+
+    def column(self, name: str) -> Any:
+        if name in self._columns:
+            return self._columns[name]
+        schema = self._datetime_cls._schema
+        if name not in schema.timestamps:
+            raise KeyError(name)
+        return self._field_column(schema.timestamp_fields[schema.timestamps.index(name)])
+
+    def _field_column(self, field: Timestamp) -> Any:
+        from .transformer import TimestampTransformer
+
+        if not isinstance(field, TimestampTransformer):
+            return self._columns[field.name]
+        return field.transform_batch(self._columns[field.compile().root.name])
+
+    @property
+    def timestamp_map(self) -> dict[str, Any]:
+        return {name: self.column(name) for name in self._datetime_cls._schema.timestamps}
+
+    def units(self, component: str) -> dict[str, UnitArrays]:
+        schema = self._datetime_cls._schema
+        if component not in schema.components:
+            raise KeyError(component)
+        time_component = schema.component_fields[schema.components.index(component)]
+        return decompose(time_component.units, self._field_column(time_component.timestamp))
+
+    def materialize(self, index: int) -> T:
+        obj = self._datetime_cls.__new__(self._datetime_cls)
+        for name, column in self._columns.items():
+            setattr(obj, name, column[index].item())
+        return obj
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(self._length):
+            yield self.materialize(index)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, numbers.Integral):
+            key = operator.index(key)
+            if not -self._length <= key < self._length:
+                raise IndexError("RTSDateTimeArray index out of range")
+            return self.materialize(key)
+        return self.__class__(self._datetime_cls, {name: column[key] for name, column in self._columns.items()})
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._datetime_cls.__name__}, length={self._length})"
@@ -0,0 +1,192 @@
+import contextlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, Literal, Self
+
+from .model import RTSDateTime, Timestamp
+from .units import RTSTimeUnits
+
+MAGIC = b"RTSB"
+VERSION = 1
+_PREAMBLE = struct.Struct("<4sHcxII")
+_ALIGNMENT = 8
+
+
+def _check_byteorder():
+    if sys.byteorder != "little":
+        raise NotImplementedError("RTS binary files are little-endian and require a little-endian host")
+
+
+def _header(datetime_cls: type[RTSDateTime], fields: tuple[str, ...], dtype: str) -> bytes:
+    header = json.dumps({"schema": json.loads(datetime_cls.dump_json()), "fields": list(fields)}).encode()
+    padding = -(_PREAMBLE.size + len(header)) % _ALIGNMENT
+    return _PREAMBLE.pack(MAGIC, VERSION, dtype.encode(), len(fields), len(header) + padding) + header + b" " * padding
+
+
+def write_records(
+    target: str | os.PathLike | IO[bytes],
+    datetime_cls: type[RTSDateTime],
+    records: Iterable[RTSDateTime] | Any,
+    dtype: Literal["d", "q"] = "d",
+    chunk_size: int = 65536,
+) -> int:
+    _check_byteorder()
+    if dtype not in ("d", "q"):
+        raise ValueError(f"dtype must be 'd' or 'q', got '{dtype}'")
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as file:
+            return write_records(file, datetime_cls, records, dtype, chunk_size)
+    fields = datetime_cls._schema.settable
+    target.write(_header(datetime_cls, fields, dtype))
+    from .array import RTSDateTimeArray
+
+    if isinstance(records, RTSDateTimeArray):
+        from .vectorized import _numpy
+
+        np = _numpy()
+        matrix = np.column_stack([records[name] for name in fields]) if fields else np.empty((len(records), 0))
+        target.write(matrix.astype("<f8" if dtype == "d" else "<i8", copy=False).tobytes())
+        return len(records)
+    count = 0
+    buffer: array[Any] = array(dtype)
+    convert: Any = float if dtype == "d" else int
+    for record in records:
+        buffer.extend([convert(getattr(record, name)) for name in fields])
+        count += 1
+        if count % chunk_size == 0:
+            buffer.tofile(target)  # type: ignore[arg-type]
+            buffer = array(dtype)
+    buffer.tofile(target)  # type: ignore[arg-type]
+    return count
+
+
+class RTSRecordView:
+    __slots__ = ("_index", "_reader")
+
+    def __init__(self, reader: "RTSBinaryReader", index: int):
+        self._reader = reader
+        self._index = index
+
+    def values(self) -> tuple[float, ...]:
+        reader = self._reader
+        offset = self._index * reader.record_width
+        return tuple(reader._values[offset : offset + reader.record_width])
+
+    def __getitem__(self, name: str) -> float:
+        reader = self._reader
+        return reader._values[self._index * reader.record_width + reader._field_index[name]]
+
+    @property
+    def timestamp_map(self) -> dict[str, float]:
+        return dict(zip(self._reader.fields, self.values()))
+
+    def units(self, component: str) -> RTSTimeUnits:
+        time_component = self._reader.datetime_cls._component_map()[component]
+        return time_component.units.from_utc_timestamp(self[time_component.timestamp.name])
+
+    def materialize(self) -> RTSDateTime:
+        datetime_cls = self._reader.datetime_cls
+        obj = datetime_cls.__new__(datetime_cls)
+        settable = datetime_cls._schema.settable_set
+        for name, value in zip(self._reader.fields, self.values()):
+            if name in settable:
+                setattr(obj, name, value)
+        return obj
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={value}" for name, value in self.timestamp_map.items())
+        return f"{self.__class__.__name__}({self._index}: {values})"
+
+
+class RTSBinaryReader:
+    def __init__(self, path: str | os.PathLike):
+        _check_byteorder()
+        with open(path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"'{path}' is not an RTS binary file") from None
+        if len(self._mmap) < _PREAMBLE.size:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not an RTS binary file")
+        magic, version, dtype, field_count, header_length = _PREAMBLE.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not an RTS binary file")
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"unsupported RTS binary version {version}")
+        if len(self._mmap) < _PREAMBLE.size + header_length:
+            self._mmap.close()
+            raise ValueError(f"'{path}' has a truncated RTS binary header")
+        header = json.loads(bytes(self._mmap[_PREAMBLE.size : _PREAMBLE.size + header_length]))
+        self.fields: tuple[str, ...] = tuple(header["fields"])
+        self.dtype: str = dtype.decode()
+        self.record_width = field_count
+        self._data_offset = _PREAMBLE.size + header_length
+        if (len(self._mmap) - self._data_offset) % (struct.calcsize(self.dtype) * max(field_count, 1)):
+            self._mmap.close()
+            raise ValueError(f"'{path}' ends partway through a record")
+        datetime_cls = RTSDateTime.load_json(json.dumps(header["schema"]))
+        unreferenced = [name for name in self.fields if name not in datetime_cls._schema.settable_set]
+        if unreferenced:
+            namespace = {name: Timestamp() for name in unreferenced}
+            datetime_cls = type(datetime_cls)(datetime_cls.__name__, (datetime_cls,), namespace)
+        self.datetime_cls = datetime_cls
+        self._field_index = {name: index for index, name in enumerate(self.fields)}
+        self._buffer = memoryview(self._mmap)
+        self._values = self._buffer[self._data_offset :].cast(self.dtype)
+        self._length = len(self._values) // field_count if field_count else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RTSRecordView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RTS binary record index out of range")
+        return RTSRecordView(self, index)
+
+    def __iter__(self) -> Iterator[RTSRecordView]:
+        for index in range(self._length):
+            yield RTSRecordView(self, index)
+
+    def column(self, name: str) -> memoryview:
+        return self._values[self._field_index[name] :: self.record_width]
+
+    def to_numpy(self) -> Any:
+        from .vectorized import _numpy
+
+        np = _numpy()
+        dtype = "<f8" if self.dtype == "d" else "<i8"
+        matrix = np.frombuffer(self._mmap, dtype=dtype, count=self._length * self.record_width, offset=self._data_offset)
+        return matrix.reshape(self._length, self.record_width)
+
+    def to_array(self) -> Any:
+        from .array import RTSDateTimeArray
+
+        matrix = self.to_numpy()
+        settable = self.datetime_cls._schema.settable_set
+        columns = {name: matrix[:, index] for index, name in enumerate(self.fields) if name in settable}
+        return RTSDateTimeArray(self.datetime_cls, columns)
+
+    def close(self):
+        for name in ("_values", "_buffer"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        # arrays from to_numpy() share the mapping zero-copy; it is unmapped once the last of them is freed
+        with contextlib.suppress(BufferError):
+            self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
@@ -0,0 +1,200 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from .codegen import decomposer
+from .formatting import compile_template
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+MAX_EXACT_RENDERS = 64
+
+
+class _Entry:
+    __slots__ = ("expires", "rendered", "visuals")
+
+    def __init__(self, expires: float, visuals: dict[str, int]):
+        self.expires = expires
+        self.visuals = visuals
+        self.rendered: dict[tuple[str | None, float | None], str] = {}
+
+
+class UnitCache:
+    def __init__(
+        self,
+        time_units: type["RTSTimeUnits"],
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        resolution: str | None = None,
+        policy: Literal["lru", "fifo"] = "lru",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        schema = time_units._schema
+        if not schema.names:
+            raise ValueError(f"{time_units.__name__} has no units to cache")
+        if resolution is None:
+            resolution = min(schema.names, key=lambda name: schema.lengths[schema.positions[name]])
+        if resolution not in schema.name_set:
+            raise TypeError(f"{time_units.__name__} has no unit {resolution}")
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"unknown eviction policy {policy!r}")
+        self.time_units = time_units
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.resolution = resolution
+        self.policy = policy
+        self._clock = clock
+        self._length = schema.lengths[schema.positions[resolution]]
+        step = Fraction(self._length)
+        self._indices = tuple(
+            index for index, length in enumerate(schema.lengths) if (Fraction(length) / step).denominator == 1
+        )
+        self.cached_units = frozenset(schema.names[index] for index in self._indices)
+        self._templates: dict[str | None, bool] = {None: self.cached_units == schema.name_set}
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def entry(self, timestamp: float) -> _Entry:
+        key = math.floor(timestamp / self._length)
+        now = self._clock() if self.ttl is not None else 0.0
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or entry.expires > now):
+                self._hits += 1
+                if self.policy == "lru":
+                    self._entries.move_to_end(key)
+                return entry
+            self._misses += 1
+        names = self.time_units._schema.names
+        values = decomposer(self.time_units)(key * self._length)
+        visuals = {names[index]: values[index] for index in self._indices}
+        entry = _Entry(now + self.ttl if self.ttl is not None else 0.0, visuals)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return entry
+
+    def _quantized(self, template: str | None) -> bool:
+        with self._lock:
+            quantized = self._templates.get(template)
+        if quantized is None:
+            fields = compile_template(self.time_units, template).fields  # type: ignore[arg-type]
+            quantized = all(field.unit in self.cached_units for field in fields)
+            with self._lock:
+                self._templates[template] = quantized
+        return quantized
+
+    def render(self, units: "RTSTimeUnits", template: str | None, render: Callable[[], str]) -> str:
+        timestamp = units.timestamp
+        entry = self.entry(timestamp)
+        key = (template, None if self._quantized(template) else timestamp)
+        with self._lock:
+            text = entry.rendered.get(key)
+        if text is None:
+            text = render()
+            with self._lock:
+                if key[1] is None or len(entry.rendered) < MAX_EXACT_RENDERS:
+                    entry.rendered[key] = text
+        return text
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.time_units.__name__}, resolution={self.resolution!r})"
+
+
+_lock = threading.Lock()
+_caches: dict[type["RTSTimeUnits"], tuple[UnitCache, dict[str, Any]]] = {}
+_MISSING = object()
+
+
+def _install(cache: UnitCache) -> dict[str, Any]:
+    time_units = cache.time_units
+    originals = {name: time_units.__dict__.get(name, _MISSING) for name in ("from_utc_timestamp", "format", "__str__")}
+    from_utc_timestamp = time_units.from_utc_timestamp.__func__  # type: ignore[attr-defined]
+    format = time_units.format
+    to_str = time_units.__str__
+
+    def cached_from_utc_timestamp(cls: type["RTSTimeUnits"], timestamp: float) -> "RTSTimeUnits":
+        units = from_utc_timestamp(cls, timestamp)
+        if cls is time_units:
+            units._unit_cache = (units.timestamp, {}, dict(cache.entry(units.timestamp).visuals))
+        return units
+
+    def cached_format(self: "RTSTimeUnits", template: str) -> str:
+        if type(self) is not time_units:
+            return format(self, template)
+        return cache.render(self, template, lambda: format(self, template))
+
+    def cached_str(self: "RTSTimeUnits") -> str:
+        if type(self) is not time_units:
+            return to_str(self)
+        return cache.render(self, None, lambda: to_str(self))
+
+    time_units.from_utc_timestamp = classmethod(cached_from_utc_timestamp)  # type: ignore[method-assign,assignment]
+    time_units.format = cached_format  # type: ignore[method-assign]
+    time_units.__str__ = cached_str  # type: ignore[method-assign,assignment]
+    return originals
+
+
+def enable_cache(
+    time_units: type["RTSTimeUnits"],
+    maxsize: int = 1024,
+    ttl: float | None = None,
+    resolution: str | None = None,
+    policy: Literal["lru", "fifo"] = "lru",
+) -> UnitCache:
+    with _lock:
+        if time_units in _caches:
+            raise RuntimeError(f"caching is already enabled for {time_units.__name__}")
+        cache = UnitCache(time_units, maxsize=maxsize, ttl=ttl, resolution=resolution, policy=policy)
+        _caches[time_units] = (cache, _install(cache))
+        return cache
+
+
+def disable_cache(time_units: type["RTSTimeUnits"]):
+    with _lock:
+        cache_state = _caches.pop(time_units, None)
+        if cache_state is None:
+            return
+        for name, original in cache_state[1].items():
+            if original is _MISSING:
+                delattr(time_units, name)
+            else:
+                setattr(time_units, name, original)
+
+
+def get_cache(time_units: type["RTSTimeUnits"]) -> UnitCache | None:
+    cache_state = _caches.get(time_units)
+    return cache_state[0] if cache_state is not None else None
@@ -0,0 +1,246 @@
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import datetime
+import io
+import itertools
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import IO, Any
+
+from . import default_units
+from .model import RTSDateTime
+from .units import utc_timestamp
+
+BUILTIN_UNITS = ("RSTUnits", "RSTStandardUnits", "StandardUnits")
+
+
+class ConversionError(ValueError):
+    pass
+
+
+def _timestamp(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return utc_timestamp(datetime.datetime.fromisoformat(value), assume_utc=True)
+
+
+class _Converter:
+    def __init__(
+        self, schema: str, input_format: str, columns: dict[str, str | int], template: str | None, output_format: str
+    ):
+        self.datetime_cls = RTSDateTime.load_json(schema)
+        self.input_format = input_format
+        self.columns = columns
+        self.template = template
+        self.output_format = output_format
+
+    def convert(self, record: Any) -> str:
+        source = json.loads(record) if self.input_format == "ndjson" else record
+        obj = self.datetime_cls(**{field: _timestamp(source[key]) for field, key in self.columns.items()})
+        rst_timestamp = obj.rst_timestamp()
+        formatted = obj.format(self.template) if self.template is not None else None
+        if self.output_format == "ndjson":
+            output = {"rst_timestamp": rst_timestamp}
+            if formatted is not None:
+                output["formatted"] = formatted
+            return json.dumps(output)
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow(
+            [rst_timestamp] if formatted is None else [rst_timestamp, formatted]
+        )
+        return buffer.getvalue()
+
+    def convert_chunk(self, records: Sequence[tuple[int, Any]], skip_invalid: bool) -> tuple[list[str], list[str]]:
+        output: list[str] = []
+        errors: list[str] = []
+        for lineno, record in records:
+            try:
+                output.append(self.convert(record))
+            except (KeyError, IndexError, ValueError, TypeError) as exc:
+                message = f"line {lineno}: {exc!r}"
+                if not skip_invalid:
+                    raise ConversionError(message) from None
+                errors.append(message)
+        return output, errors
+
+
+_worker: _Converter | None = None
+
+
+def _init_worker(*args: Any):
+    global _worker
+    _worker = _Converter(*args)
+
+
+def _convert_chunk(records: Sequence[tuple[int, Any]], skip_invalid: bool) -> tuple[list[str], list[str]]:
+    assert _worker is not None
+    return _worker.convert_chunk(records, skip_invalid)
+
+
+def builtin_schema(units_name: str) -> str:
+    time_units = getattr(default_units, units_name)
+    return json.dumps({"units": {"units": time_units.to_dict(), "timestamp": "timestamp"}})
+
+
+def _streams(paths: Sequence[str]) -> Iterator[IO[str]]:
+    for path in paths:
+        if path == "-":
+            yield sys.stdin
+        else:
+            with open(path, newline="") as stream:
+                yield stream
+
+
+def _column_keys(specs: Sequence[str] | None, fields: Sequence[str], input_format: str) -> dict[str, str | int]:
+    if not fields:
+        raise ConversionError("schema has no settable timestamps")
+    if specs is None:
+        if len(fields) == 1:
+            return {fields[0]: "timestamp" if input_format == "ndjson" else 0}
+        return {field: field for field in fields}
+    keys: dict[str, str | int] = {}
+    for spec in specs:
+        field, separator, column = spec.partition("=")
+        if not separator or field not in fields:
+            if len(fields) != 1:
+                raise ConversionError(f"schema has timestamps {', '.join(fields)}, pass --column FIELD=COLUMN for each")
+            field, column = fields[0], spec
+        keys[field] = int(column) if input_format == "csv" and column.isdigit() else column
+    return keys
+
+
+def _records(
+    paths: Sequence[str], input_format: str, keys: dict[str, str | int]
+) -> tuple[Iterator[tuple[int, Any]], dict[str, str | int]]:
+    named = input_format == "csv" and any(isinstance(key, str) for key in keys.values())
+    resolved: list[dict[str, str | int]] = []
+
+    def numbered() -> Iterator[tuple[int, Any]]:
+        for stream in _streams(paths):
+            if input_format == "ndjson":
+                yield from ((lineno, line) for lineno, line in enumerate(stream, 1) if line.strip())
+                continue
+            reader = csv.reader(stream)
+            if named:
+                header = next(reader, [])
+                missing = [key for key in keys.values() if isinstance(key, str) and key not in header]
+                if missing:
+                    raise ConversionError(f"column {missing[0]!r} not found in CSV header")
+                indexes: dict[str, str | int] = {field: header.index(key) if isinstance(key, str) else key for field, key in keys.items()}
+                if resolved and resolved[0] != indexes:
+                    raise ConversionError("columns moved between CSV inputs")
+                resolved.append(indexes)
+            for row in reader:
+                if row:
+                    yield reader.line_num, row
+
+    iterator = numbered()
+    if not named:
+        return iterator, keys
+    first = next(iterator, None)
+    if not resolved:
+        return iter(()), keys
+    return itertools.chain([] if first is None else [first], iterator), resolved[0]
+
+
+def _chunks(records: Iterable[tuple[int, Any]], size: int) -> Iterator[list[tuple[int, Any]]]:
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def convert(args: argparse.Namespace) -> int:
+    if args.schema is not None:
+        with open(args.schema) as stream:
+            schema = stream.read()
+    else:
+        schema = builtin_schema(args.units)
+    try:
+        fields = RTSDateTime.load_json(schema)._schema.settable
+        keys = _column_keys(args.column, fields, args.input_format)
+        records, columns = _records(args.inputs, args.input_format, keys)
+    except ConversionError as exc:
+        print(f"rtsdatetime: {exc}", file=sys.stderr)
+        return 1
+    worker_args = (schema, args.input_format, columns, args.template, args.output_format)
+    rows = 0
+    started = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        output: IO[str] = sys.stdout if args.output == "-" else stack.enter_context(open(args.output, "w", newline=""))
+
+        def emit(result: tuple[list[str], list[str]]):
+            nonlocal rows
+            converted, errors = result
+            for error in errors:
+                print(f"rtsdatetime: skipped {error}", file=sys.stderr)
+            if converted:
+                output.write("\n".join(converted))
+                output.write("\n")
+            rows += len(converted)
+
+        try:
+            if args.workers <= 0:
+                converter = _Converter(*worker_args)
+                for chunk in _chunks(records, args.chunk_size):
+                    emit(converter.convert_chunk(chunk, args.skip_invalid))
+            else:
+                with concurrent.futures.ProcessPoolExecutor(
+                    args.workers, initializer=_init_worker, initargs=worker_args
+                ) as executor:
+                    pending: collections.deque[concurrent.futures.Future] = collections.deque()
+                    for chunk in _chunks(records, args.chunk_size):
+                        pending.append(executor.submit(_convert_chunk, chunk, args.skip_invalid))
+                        if len(pending) >= args.workers * 2:
+                            emit(pending.popleft().result())
+                    while pending:
+                        emit(pending.popleft().result())
+        except ConversionError as exc:
+            print(f"rtsdatetime: {exc}", file=sys.stderr)
+            return 1
+        finally:
+            output.flush()
+    if not args.quiet:
+        elapsed = time.perf_counter() - started
+        rate = rows / elapsed if elapsed > 0 else float("inf")
+        print(f"rtsdatetime: converted {rows} rows in {elapsed:.3f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m rtsdatetime")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    convert_parser = subcommands.add_parser(
+        "convert", help="convert UTC timestamps or ISO datetimes to rts timestamps"
+    )
+    convert_parser.add_argument("inputs", nargs="*", default=["-"], help="input files, - for stdin")
+    convert_parser.add_argument("--input-format", choices=("csv", "ndjson"), default="csv")
+    convert_parser.add_argument("--output-format", choices=("csv", "ndjson"), default="csv")
+    convert_parser.add_argument(
+        "--column",
+        action="append",
+        help="CSV column index or header name (default 0), or NDJSON key (default timestamp); "
+        "use FIELD=COLUMN once per timestamp for schemas with several timestamps (default: the field names)",
+    )
+    schema = convert_parser.add_mutually_exclusive_group()
+    schema.add_argument("--schema", help="file containing RTSDateTime.dump_json() output")
+    schema.add_argument("--units", choices=BUILTIN_UNITS, default="RSTUnits")
+    convert_parser.add_argument("--template", help="format template, e.g. '[units.day] [units.octa]'")
+    convert_parser.add_argument("--workers", type=int, default=0, help="worker processes, 0 converts in-process")
+    convert_parser.add_argument("--chunk-size", type=int, default=10000)
+    convert_parser.add_argument("--skip-invalid", action="store_true")
+    convert_parser.add_argument("--output", default="-")
+    convert_parser.add_argument("--quiet", action="store_true")
+    convert_parser.set_defaults(handler=convert)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
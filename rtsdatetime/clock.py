@@ -0,0 +1,138 @@
+import math
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .codegen import decomposer
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+
+def _visual(quotient: int, wrap: int, negative: bool) -> int:
+    if not negative:
+        return quotient % wrap if wrap else quotient
+    if not wrap:
+        return -quotient
+    remainder = quotient % wrap
+    return wrap - 1 - remainder if remainder else 0
+
+
+class RTSClock:
+    __slots__ = (
+        "_clock",
+        "_ends",
+        "_epoch",
+        "_lengths",
+        "_names",
+        "_order",
+        "_quotients",
+        "_ratio",
+        "_starts",
+        "_timestamp",
+        "_values",
+        "_wraps",
+        "changed",
+        "time_units",
+    )
+
+    def __init__(
+        self,
+        time_units: type["RTSTimeUnits"],
+        timestamp: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        schema = time_units._schema
+        if schema.seconds_ratio is None:
+            raise AttributeError(f"{time_units.__name__} must have a seconds_ratio attribute")
+        self.time_units = time_units
+        self._clock = clock
+        self._ratio = schema.seconds_ratio
+        self._epoch = schema.epoch_timestamp
+        self._names = schema.names
+        self._lengths = schema.lengths
+        self._wraps = schema.wraps
+        self._order = sorted(range(len(schema.names)), key=lambda index: schema.lengths[index])
+        self._starts = [0.0] * len(schema.names)
+        self._ends = [0.0] * len(schema.names)
+        self._quotients = [0] * len(schema.names)
+        self._values: list[int] = [0] * len(schema.names)
+        self._timestamp = 0.0
+        self.changed: tuple[str, ...] = ()
+        self._reset(self._unit_timestamp(self._clock() if timestamp is None else timestamp))
+
+    def _unit_timestamp(self, timestamp: float) -> float:
+        return (timestamp - self._epoch) * self._ratio
+
+    def _window(self, index: int, timestamp: float):
+        length = self._lengths[index]
+        quotient = math.floor(timestamp / length)
+        self._quotients[index] = quotient
+        self._starts[index] = quotient * length
+        self._ends[index] = (quotient + 1) * length
+
+    def _reset(self, timestamp: float) -> tuple[str, ...]:
+        previous = self._values
+        values = list(decomposer(self.time_units)(timestamp))
+        for index in range(len(values)):
+            self._window(index, timestamp)
+        self._timestamp = timestamp
+        self._values = values
+        self.changed = tuple(name for name, old, new in zip(self._names, previous, values) if old != new)
+        return self.changed
+
+    def set_unit_timestamp(self, timestamp: float) -> tuple[str, ...]:
+        previous = self._timestamp
+        if (timestamp < 0) != (previous < 0) or not self._order:
+            return self._reset(timestamp)
+        if abs(timestamp - previous) >= self._lengths[self._order[-1]]:
+            return self._reset(timestamp)
+        self._timestamp = timestamp
+        starts, ends = self._starts, self._ends
+        first = self._order[0]
+        if starts[first] <= timestamp < ends[first]:
+            self.changed = ()
+            return self.changed
+        negative = timestamp < 0
+        changed = []
+        for index in self._order:
+            if starts[index] <= timestamp < ends[index]:
+                continue
+            self._window(index, timestamp)
+            value = _visual(self._quotients[index], self._wraps[index], negative)
+            if value != self._values[index]:
+                self._values[index] = value
+                changed.append(index)
+        changed.sort()
+        self.changed = tuple(self._names[index] for index in changed)
+        return self.changed
+
+    def set(self, timestamp: float) -> tuple[str, ...]:
+        return self.set_unit_timestamp(self._unit_timestamp(timestamp))
+
+    def advance(self, seconds: float) -> tuple[str, ...]:
+        return self.set_unit_timestamp(self._timestamp + seconds * self._ratio)
+
+    def tick(self) -> tuple[str, ...]:
+        return self.set(self._clock())
+
+    @property
+    def timestamp(self) -> float:
+        return self._timestamp
+
+    @property
+    def values(self) -> tuple[int, ...]:
+        return tuple(self._values)
+
+    @property
+    def units(self) -> dict[str, int]:
+        return dict(zip(self._names, self._values))
+
+    def __getitem__(self, name: str) -> int:
+        return self._values[self.time_units._schema.positions[name]]
+
+    def now(self) -> "RTSTimeUnits":
+        return self.time_units.from_timestamp(self._timestamp)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.time_units.__name__}, timestamp={self._timestamp})"
@@ -0,0 +1,106 @@
+from collections.abc import Callable, MutableSequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+CODEGEN_VERSION = 1
+
+type Decomposer = Callable[[float], tuple[int, ...]]
+type DecomposerInto = Callable[[float, MutableSequence[int]], MutableSequence[int]]
+
+_functions: dict[str, tuple[Decomposer, DecomposerInto]] = {}
+
+
+def _quotients(lengths: tuple[float, ...]) -> list[str]:
+    from fractions import Fraction
+
+    order = sorted(range(len(lengths)), key=lambda index: lengths[index])
+    computed: list[int] = []
+    lines = []
+    for index in order:
+        length = Fraction(lengths[index])
+        source = None
+        for previous in reversed(computed):
+            ratio = length / Fraction(lengths[previous])
+            if ratio.denominator == 1:
+                source = previous
+                break
+        if source is None:
+            lines.append(f"q{index} = int(t // {lengths[index]!r})")
+        elif length == Fraction(lengths[source]):
+            lines.append(f"q{index} = q{source}")
+        else:
+            lines.append(f"q{index} = q{source} // {int(length / Fraction(lengths[source]))}")
+        computed.append(index)
+    return lines
+
+
+def _positive(index: int, wrap: int) -> str:
+    return f"q{index} % {wrap}" if wrap else f"q{index}"
+
+
+def _negative(index: int, wrap: int) -> tuple[str | None, str]:
+    if not wrap:
+        return None, f"-q{index}"
+    return f"a{index} = q{index} % {wrap}", f"{wrap - 1} - a{index} if a{index} else 0"
+
+
+def _tuple(values: list[str]) -> str:
+    return f"({', '.join(values)},)" if values else "()"
+
+
+def generate_source(lengths: tuple[float, ...], wraps: tuple[int, ...]) -> str:
+    quotients = _quotients(lengths)
+    negatives = [_negative(index, wrap) for index, wrap in enumerate(wraps)]
+    positives = [_positive(index, wrap) for index, wrap in enumerate(wraps)]
+    remainders = [line for line, _ in negatives if line is not None]
+    lines = []
+    for name, emit in (("decompose", None), ("decompose_into", "out")):
+        lines.append(f"def {name}(t{', out' if emit else ''}):")
+        if lengths:
+            lines.append("    if t < 0:")
+            lines.extend(f"        {line}" for line in quotients + remainders)
+            if emit:
+                lines.extend(f"        out[{index}] = {value}" for index, (_, value) in enumerate(negatives))
+                lines.append("        return out")
+            else:
+                lines.append(f"        return {_tuple([value for _, value in negatives])}")
+            lines.extend(f"    {line}" for line in quotients)
+        if emit:
+            lines.extend(f"    out[{index}] = {value}" for index, value in enumerate(positives))
+            lines.append("    return out")
+        else:
+            lines.append(f"    return {_tuple(positives)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def load_functions(lengths: tuple[float, ...], wraps: tuple[int, ...]) -> tuple[Decomposer, DecomposerInto]:
+    from .registry import schema_hash
+
+    key = schema_hash({"version": CODEGEN_VERSION, "lengths": lengths, "wraps": wraps})
+    functions = _functions.get(key)
+    if functions is not None:
+        return functions
+    namespace: dict[str, Any] = {}
+    exec(compile(generate_source(lengths, wraps), f"<rtsdatetime-codegen-{key}>", "exec"), namespace)  # noqa: S102 - source is generated from integer lengths only
+    functions = _functions[key] = (namespace["decompose"], namespace["decompose_into"])
+    return functions
+
+
+def _cached_functions(time_units: type["RTSTimeUnits"]) -> tuple[Decomposer, DecomposerInto]:
+    schema = time_units._schema
+    cached = time_units.__dict__.get("_codegen")
+    if cached is None or cached[0] is not schema:
+        cached = (schema, load_functions(schema.lengths, schema.wraps))
+        time_units._codegen = cached  # type: ignore[attr-defined]
+    return cached[1]
+
+
+def decomposer(time_units: type["RTSTimeUnits"]) -> Decomposer:
+    return _cached_functions(time_units)[0]
+
+
+def decomposer_into(time_units: type["RTSTimeUnits"]) -> DecomposerInto:
+    return _cached_functions(time_units)[1]
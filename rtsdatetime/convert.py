@@ -0,0 +1,80 @@
+import weakref
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from .units import visual_unit_value
+from .vectorized import _numpy
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+
+class UnitConverter:
+    __slots__ = ("_source", "_source_lengths", "_target", "_target_layout", "offset", "scale")
+
+    def __init__(self, source: type["RTSTimeUnits"], target: type["RTSTimeUnits"]):
+        for time_units in (source, target):
+            if time_units.seconds_ratio is None:
+                raise AttributeError(f"{time_units.__name__} must have a seconds_ratio attribute")
+        # held weakly so the converter cache does not keep dynamically created unit classes alive
+        self._source = weakref.ref(source)
+        self._target = weakref.ref(target)
+        self.scale = target.seconds_ratio / source.seconds_ratio  # type: ignore[operator]
+        epoch_offset = source._schema.epoch_timestamp - target._schema.epoch_timestamp
+        self.offset = epoch_offset * target.seconds_ratio  # type: ignore[operator]
+        self._source_lengths = dict(zip(source._schema.names, source._schema.lengths))
+        target_schema = target._schema
+        self._target_layout = dict(zip(target_schema.names, zip(target_schema.lengths, target_schema.wraps)))
+
+    @property
+    def source(self) -> type["RTSTimeUnits"]:
+        return self._source()  # type: ignore[return-value]
+
+    @property
+    def target(self) -> type["RTSTimeUnits"]:
+        return self._target()  # type: ignore[return-value]
+
+    def __call__(self, timestamp: float) -> float:
+        return timestamp * self.scale + self.offset
+
+    def batch(self, timestamps: Any) -> Any:
+        np = _numpy()
+        return np.asarray(timestamps, dtype=np.float64) * self.scale + self.offset
+
+    def convert(self, units: "RTSTimeUnits") -> "RTSTimeUnits":
+        if not isinstance(units, self.source):
+            raise TypeError(f"expected {self.source.__name__}, got {type(units).__name__}")
+        return self.target.from_timestamp(units.timestamp * self.scale + self.offset)
+
+    def units(self, values: Mapping[str, float], names: Iterable[str] | None = None) -> tuple[int, ...]:
+        lengths = self._source_lengths
+        try:
+            timestamp = sum(value * lengths[name] for name, value in values.items())
+        except KeyError as exc:
+            raise TypeError(f"{self.source.__name__} has no unit {exc.args[0]}") from None
+        timestamp = timestamp * self.scale + self.offset
+        layout = self._target_layout
+        if names is None:
+            return tuple(visual_unit_value(timestamp, length, wrap) for length, wrap in layout.values())
+        try:
+            return tuple(visual_unit_value(timestamp, *layout[name]) for name in names)
+        except KeyError as exc:
+            raise TypeError(f"{self.target.__name__} has no unit {exc.args[0]}") from None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.source.__name__} -> {self.target.__name__})"
+
+
+type _Targets = weakref.WeakKeyDictionary[type["RTSTimeUnits"], UnitConverter]
+
+_converters: "weakref.WeakKeyDictionary[type[RTSTimeUnits], _Targets]" = weakref.WeakKeyDictionary()
+
+
+def converter(source: type["RTSTimeUnits"], target: type["RTSTimeUnits"]) -> UnitConverter:
+    targets = _converters.get(source)
+    if targets is None:
+        targets = _converters[source] = weakref.WeakKeyDictionary()
+    convert = targets.get(target)
+    if convert is None:
+        convert = targets[target] = UnitConverter(source, target)
+    return convert
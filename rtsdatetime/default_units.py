@@ -1,7 +1,5 @@
 import datetime
-import secrets
 from .units import RTSTimeUnits, RTSUnit
-from dataclasses import dataclass
 
 
 class RSTUnits(RTSTimeUnits):
@@ -34,5 +32,5 @@ class StandardUnits(RTSTimeUnits):
     minute: RTSUnit = RTSUnit(60, 60)
     second: RTSUnit = RTSUnit(1, 60)
     seconds_ratio = 1
-    epoch = datetime.datetime.fromtimestamp(0)
+    epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
 
@@ -0,0 +1,221 @@
+import re
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .units import RTSTimeUnits, visual_unit_value
+
+if TYPE_CHECKING:
+    from .model import RTSDateTime, TimeComponent
+
+_TOKEN = re.compile(r"\[(?:(\w+)\.)?(\w+)(?::([^\]]*))?\]")
+MAX_TEMPLATES = 256
+
+type _Owner = type[RTSTimeUnits | "RTSDateTime"]
+
+
+class _Field(NamedTuple):
+    component: str | None
+    unit: str
+    length: float
+    wrap: int
+    spec: str
+
+
+class Template(NamedTuple):
+    literals: tuple[str, ...]
+    fields: tuple[_Field, ...]
+    components: tuple[str, ...]
+    # the TimeComponent behind each name in components, resolved once so formatting skips the class lookup
+    component_fields: tuple["TimeComponent", ...]
+
+
+def _abbreviations(units: type[RTSTimeUnits]) -> dict[str, str]:
+    abbreviations: dict[str, list[str]] = {}
+    for name in units._schema.names:
+        parts = name.split("_")
+        abbreviation = "".join(part[0] for part in parts) if len(parts) > 1 else name[:2]
+        abbreviations.setdefault(abbreviation.upper(), []).append(name)
+    return {abbreviation: names[0] for abbreviation, names in abbreviations.items() if len(names) == 1}
+
+
+def _resolve_unit(units: type[RTSTimeUnits], code: str) -> str:
+    if code in units._schema.name_set:
+        return code
+    name = _abbreviations(units).get(code)
+    if name is None:
+        raise ValueError(f"{units.__name__} has no unit '{code}'")
+    return name
+
+
+def _component_units(owner: Any, component: str | None) -> type[RTSTimeUnits]:
+    if issubclass(owner, RTSTimeUnits):
+        if component is not None:
+            raise ValueError(f"{owner.__name__} templates cannot reference component '{component}'")
+        return owner
+    if component is None:
+        raise ValueError(f"{owner.__name__} templates must reference units as [component.UNIT]")
+    component_map = owner._component_map()
+    if component not in component_map:
+        raise ValueError(f"{owner.__name__} has no component '{component}'")
+    return component_map[component].units
+
+
+def _memoize[V](
+    cache: "weakref.WeakKeyDictionary[Any, OrderedDict[str, V]]", owner: Any, template: str, build: Callable[[], V]
+) -> V:
+    entries = cache.get(owner)
+    if entries is None:
+        entries = cache[owner] = OrderedDict()
+    value = entries.get(template)
+    if value is None:
+        value = entries[template] = build()
+        if len(entries) > MAX_TEMPLATES:
+            entries.popitem(last=False)
+    else:
+        entries.move_to_end(template)
+    return value
+
+
+_templates: "weakref.WeakKeyDictionary[Any, OrderedDict[str, Template]]" = weakref.WeakKeyDictionary()
+
+
+def compile_template(owner: _Owner, template: str) -> Template:
+    return _memoize(_templates, owner, template, lambda: _compile_template(owner, template))
+
+
+def _compile_template(owner: _Owner, template: str) -> Template:
+    literals: list[str] = []
+    fields: list[_Field] = []
+    position = 0
+    for match in _TOKEN.finditer(template):
+        component, code, spec = match.groups()
+        units = _component_units(owner, component)
+        name = _resolve_unit(units, code)
+        spec = spec or ""
+        format(0, spec)
+        index = units._schema.positions[name]
+        literals.append(template[position : match.start()])
+        fields.append(_Field(component, name, units._schema.lengths[index], units._schema.wraps[index], spec))
+        position = match.end()
+    literals.append(template[position:])
+    components = tuple(dict.fromkeys(field.component for field in fields if field.component is not None))
+    component_map = owner._component_map() if components else {}  # type: ignore[union-attr]
+    return Template(tuple(literals), tuple(fields), components, tuple(component_map[name] for name in components))
+
+
+def _unit_timestamp(units: type[RTSTimeUnits], timestamp: float) -> float:
+    schema = units._schema
+    return (timestamp - schema.epoch_timestamp) * schema.seconds_ratio  # type: ignore[operator]
+
+
+def format_units(units: RTSTimeUnits, template: str) -> str:
+    program = compile_template(type(units), template)
+    timestamp = units.timestamp
+    parts = [program.literals[0]]
+    for field, literal in zip(program.fields, program.literals[1:]):
+        parts.append(format(visual_unit_value(timestamp, field.length, field.wrap), field.spec))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def format_datetime(obj: "RTSDateTime", template: str) -> str:
+    owner = type(obj)
+    program = compile_template(owner, template)
+    timestamps: dict[str, float] = {}
+    for name, component in zip(program.components, program.component_fields):
+        timestamps[name] = _unit_timestamp(component.units, component.timestamp.__get__(obj, owner))
+    parts = [program.literals[0]]
+    for field, literal in zip(program.fields, program.literals[1:]):
+        value = visual_unit_value(timestamps[field.component], field.length, field.wrap)  # type: ignore[index]
+        parts.append(format(value, field.spec))
+        parts.append(literal)
+    return "".join(parts)
+
+
+class _Parser(NamedTuple):
+    pattern: re.Pattern[str]
+    fields: tuple[_Field, ...]
+
+
+_parsers: "weakref.WeakKeyDictionary[Any, OrderedDict[str, _Parser]]" = weakref.WeakKeyDictionary()
+
+
+def compile_parser(owner: _Owner, template: str) -> _Parser:
+    return _memoize(_parsers, owner, template, lambda: _compile_parser(owner, template))
+
+
+def _compile_parser(owner: _Owner, template: str) -> _Parser:
+    program = compile_template(owner, template)
+    if not issubclass(owner, RTSTimeUnits):
+        component_map = owner._component_map()
+        settable = owner._schema.settable_set
+        seen: dict[str, str] = {}
+        for name in program.components:
+            timestamp_name = component_map[name].timestamp.name
+            if timestamp_name not in settable:
+                raise ValueError(f"component '{name}' is backed by read-only timestamp '{timestamp_name}'")
+            if timestamp_name in seen:
+                raise ValueError(f"components '{seen[timestamp_name]}' and '{name}' share timestamp '{timestamp_name}'")
+            seen[timestamp_name] = name
+    pattern = re.escape(program.literals[0]) + "".join(
+        _field_pattern(field.spec) + re.escape(literal) for field, literal in zip(program.fields, program.literals[1:])
+    )
+    return _Parser(re.compile(pattern), program.fields)
+
+
+def _field_pattern(spec: str) -> str:
+    zero_padded = re.fullmatch(r"0(\d+)", spec)
+    if zero_padded:
+        return f"(-\\d+|\\d{{{int(zero_padded.group(1))},}})"
+    return " *(-?\\d+) *"
+
+
+def _parse_values(owner: Any, template: str, text: str) -> dict[str | None, dict[str, int]]:
+    parser = compile_parser(owner, template)
+    match = parser.pattern.fullmatch(text)
+    if match is None:
+        raise ValueError(f"'{text}' does not match template '{template}'")
+    values: dict[str | None, dict[str, int]] = {}
+    for field, raw in zip(parser.fields, match.groups()):
+        unit_values = values.setdefault(field.component, {})
+        value = int(raw)
+        if unit_values.setdefault(field.unit, value) != value:
+            raise ValueError(f"conflicting values for '{field.unit}' in '{text}'")
+    return values
+
+
+def compose_unit_values(units: type[RTSTimeUnits], unit_values: dict[str, int]) -> float:
+    schema = units._schema
+    order = sorted(
+        (schema.positions[name] for name in unit_values),
+        key=lambda index: (-schema.lengths[index], schema.wraps[index] != 0),
+    )
+    timestamp: float = 0
+    for index in order:
+        length, wrap = schema.lengths[index], schema.wraps[index]
+        value = unit_values[schema.names[index]]
+        current = timestamp // length
+        quotient = current + (value - current % wrap) % wrap if wrap else value
+        timestamp = max(timestamp, quotient * length) if quotient >= current else quotient * length
+    if timestamp >= 0:
+        for name, value in unit_values.items():
+            index = schema.positions[name]
+            if visual_unit_value(timestamp, schema.lengths[index], schema.wraps[index]) != value:
+                raise ValueError(f"inconsistent unit values {unit_values} for {units.__name__}")
+    return timestamp
+
+
+def parse_units[T: RTSTimeUnits](units: type[T], template: str, text: str) -> T:
+    return units.from_timestamp(compose_unit_values(units, _parse_values(units, template, text).get(None, {})))
+
+
+def parse_datetime[T: "RTSDateTime"](owner: type[T], template: str, text: str) -> T:
+    obj = owner.__new__(owner)
+    component_map = owner._component_map()
+    for name, unit_values in _parse_values(owner, template, text).items():
+        component = component_map[name]  # type: ignore[index]
+        timestamp = compose_unit_values(component.units, unit_values)
+        component.timestamp.__set__(obj, component.units.from_timestamp(timestamp).to_utc_timestamp())
+    return obj
@@ -0,0 +1,161 @@
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from .model import TimeComponent, Timestamp
+from .units import RTSTimeUnits, RTSUnit
+
+
+class CallCounter(NamedTuple):
+    calls: int
+    total_time: float
+
+
+type Counters = dict[tuple[str, str], CallCounter]
+
+
+class Profile:
+    def __init__(self):
+        self.counters: Counters = {}
+
+    def calls(self, target: str) -> int:
+        return sum(counter.calls for (name, _), counter in self.counters.items() if name == target)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.counters})"
+
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, str], list[float]] = {}
+_exporters: list[Callable[[Counters], None]] = []
+_originals: dict[tuple[type, str], tuple[Any, Any]] = {}
+_depth = 0
+
+
+def _record(target: str, owner: Any, elapsed: int):
+    key = (target, getattr(owner, "__name__", type(owner).__name__))
+    with _lock:
+        counter = _counters.get(key)
+        if counter is None:
+            _counters[key] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+
+def _instrument_descriptor(target: str, original: Callable[..., Any]) -> Callable[..., Any]:
+    def __get__(self: Any, obj: Any, objtype: Any = None) -> Any:
+        if not _depth:
+            return original(self, obj, objtype)
+        start = time.perf_counter_ns()
+        try:
+            return original(self, obj, objtype)
+        finally:
+            _record(target, objtype if objtype is not None else type(obj), time.perf_counter_ns() - start)
+
+    return __get__
+
+
+def _instrument_classmethod(target: str, original: Callable[..., Any]) -> classmethod:
+    def wrapper(cls: Any, *args: Any, **kwargs: Any) -> Any:
+        if not _depth:
+            return original(cls, *args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return original(cls, *args, **kwargs)
+        finally:
+            _record(target, cls, time.perf_counter_ns() - start)
+
+    return classmethod(wrapper)
+
+
+def _subclasses[T](base: type[T]) -> list[type[T]]:
+    classes, seen = [base], {base}
+    for cls in classes:
+        for subclass in cls.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                classes.append(subclass)
+    return classes
+
+
+def enable():
+    global _depth
+    with _lock:
+        _depth += 1
+        if _depth > 1:
+            return
+        for owner in (*_subclasses(Timestamp), *_subclasses(TimeComponent), *_subclasses(RTSUnit)):
+            original = owner.__dict__.get("__get__")
+            if original is not None:
+                wrapper = _instrument_descriptor(f"{owner.__name__}.__get__", original)
+                owner.__get__ = wrapper  # type: ignore[method-assign]
+                _originals[owner, "__get__"] = (original, wrapper)
+        for time_units in _subclasses(RTSTimeUnits):
+            original = time_units.__dict__.get("from_utc_timestamp")
+            if isinstance(original, classmethod):
+                wrapper = _instrument_classmethod(f"{time_units.__name__}.from_utc_timestamp", original.__func__)
+                time_units.from_utc_timestamp = wrapper  # type: ignore[method-assign,assignment]
+                _originals[time_units, "from_utc_timestamp"] = (original, wrapper)
+
+
+def disable():
+    global _depth
+    with _lock:
+        if not _depth:
+            return
+        _depth -= 1
+        if _depth:
+            return
+        for (owner, attribute), (original, wrapper) in _originals.items():
+            if owner.__dict__.get(attribute) is wrapper:
+                setattr(owner, attribute, original)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    return _depth > 0
+
+
+def snapshot() -> Counters:
+    with _lock:
+        return {key: CallCounter(int(calls), total / 1e9) for key, (calls, total) in _counters.items()}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+
+
+def add_exporter(callback: Callable[[Counters], None]):
+    _exporters.append(callback)
+
+
+def remove_exporter(callback: Callable[[Counters], None]):
+    _exporters.remove(callback)
+
+
+def export():
+    counters = snapshot()
+    for exporter in _exporters:
+        exporter(counters)
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[Profile]:
+    enable()
+    before = snapshot()
+    result = Profile()
+    try:
+        yield result
+    finally:
+        after = snapshot()
+        disable()
+        for key, counter in after.items():
+            previous = before.get(key, CallCounter(0, 0.0))
+            if counter.calls != previous.calls:
+                result.counters[key] = CallCounter(
+                    counter.calls - previous.calls, counter.total_time - previous.total_time
+                )
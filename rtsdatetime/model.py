@@ -1,13 +1,29 @@
-import base64
 import datetime
 import json
-import time
-from typing import Any, Callable, Literal, Protocol, Self, runtime_checkable, dataclass_transform
-from rtsdatetime.default_units import RSTUnits
-from .units import RTSTimeUnits
+from collections.abc import Callable, Iterable, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Literal,
+    NamedTuple,
+    Self,
+    dataclass_transform,
+    overload,
+)
+
+from .units import RTSTimeUnits, SlotsMeta, utc_timestamp
+
+if TYPE_CHECKING:
+    import os
+
+    from .array import RTSDateTimeArray
+    from .parser import RTSTimestampParseError
 
 
 class RTSTimeDelta[T: RTSTimeUnits]:
+    __slots__ = ("_time_units", "timediff")
+
     def __init__(self, timediff: int, time_units: type[T]):
         self.timediff = timediff
         self._time_units = time_units
@@ -35,65 +51,119 @@ class RTSTimeDelta[T: RTSTimeUnits]:
         return RTSTimeDelta(self.timediff - other.timediff, self._time_units)
 
 
+class _AttributeSlot:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        return getattr(obj, self.name)
+
+    def __set__(self, obj: Any, value: Any):
+        setattr(obj, self.name, value)
+
+
 class Timestamp:
+    settable: ClassVar[bool] = True
+
     def __init__(self):
         pass
 
     def __set_name__(self, owner: type["RTSDateTime"], name: str):
         self.name = name
+        slot = f"_{name}"
+        self._slot = owner.__dict__.get(slot) or _AttributeSlot(slot)
 
     def __get__(self, obj: "RTSDateTime | None", objtype: type["RTSDateTime"] | None = None) -> float:
         if obj is None and issubclass(objtype, RTSDateTime):
             return 0
         if obj is None or not issubclass(objtype, RTSDateTime):
             raise AttributeError("RTSTCTimestamp can only be accessed through RTSDateTime objects")
-        value = getattr(obj, f"_{self.name}", None)
-        if value is None:
+        try:
+            value = self._slot.__get__(obj, objtype)
+        except AttributeError:
             return 0
-        if not isinstance(value, float) and not isinstance(value, int):
-            raise ValueError(f"RTSTCTimestamp {self.name} must be of type float")
-        return value
+        if type(value) is float or isinstance(value, (float, int)):
+            return value
+        raise ValueError(f"RTSTCTimestamp {self.name} must be of type float")
 
     def __set__(self, obj: "RTSDateTime", value: datetime.datetime | RTSTimeUnits | float):
         if isinstance(value, datetime.datetime):
-            timestamp = value.timestamp()
+            timestamp = utc_timestamp(value)
         elif isinstance(value, RTSTimeUnits):
-            if value.seconds_ratio is None:
-                raise AttributeError("RTSTimeUnits must have a seconds_ratio attribute")
-            timestamp = value.timestamp * value.seconds_ratio + value.epoch.timestamp()
+            timestamp = value.to_utc_timestamp()
         elif isinstance(value, float) or isinstance(value, int):
             timestamp = value
         else:
             raise ValueError(f"RTSTCTimestamp {self.name} must be of type datetime.datetime or RTSTimeUnits")
-        setattr(obj, f"_{self.name}", timestamp)
+        self._slot.__set__(obj, timestamp)
+
+
+class DateTimeSchema(NamedTuple):
+    timestamps: tuple[str, ...]
+    timestamp_fields: tuple[Timestamp, ...]
+    settable: tuple[str, ...]
+    settable_set: frozenset[str]
+    components: tuple[str, ...]
+    component_fields: tuple["TimeComponent", ...]
+
+    @classmethod
+    def compile(cls, datetime_cls: type["RTSDateTime"]) -> "DateTimeSchema":
+        timestamp_map: dict[str, Timestamp] = {}
+        component_map: dict[str, TimeComponent] = {}
+        for klass in reversed(datetime_cls.__mro__):
+            for key, value in vars(klass).items():
+                timestamp_map.pop(key, None)
+                component_map.pop(key, None)
+                if isinstance(value, Timestamp):
+                    timestamp_map[key] = value
+                elif isinstance(value, TimeComponent):
+                    component_map[key] = value
+        settable = tuple(key for key, value in timestamp_map.items() if value.settable)
+        return cls(
+            timestamps=tuple(timestamp_map),
+            timestamp_fields=tuple(timestamp_map.values()),
+            settable=settable,
+            settable_set=frozenset(settable),
+            components=tuple(component_map),
+            component_fields=tuple(component_map.values()),
+        )
+
+
+class RTSDateTimeMeta(SlotsMeta):
+    @classmethod
+    def _generate_slots(mcls, bases: tuple[type, ...], namespace: dict[str, Any]) -> Iterable[str]:
+        for key, value in namespace.items():
+            slot = f"_{key}"
+            if isinstance(value, Timestamp) and value.settable and not any(hasattr(base, slot) for base in bases):
+                yield slot
 
 
 @dataclass_transform(field_specifiers=(Timestamp,))
-class RTSDateTime(object):
+class RTSDateTime(object, metaclass=RTSDateTimeMeta):
+    __slots__ = ("_transform_cache",)
+    _schema: ClassVar[DateTimeSchema]
+    _transform_cache: dict[Timestamp, tuple[float, float]]
+
     def __init_subclass__(cls) -> None:
         def __init__(self: "RTSDateTime", **kwargs):
-            timestamps = [key for key, value in self._timestamp_map.items() if type(value) is Timestamp]
+            settable_set = self._schema.settable_set
             for key, value in kwargs.items():
-                if key not in timestamps:
+                if key not in settable_set:
                     raise ValueError(f"Unknown timestamp '{key}'")
                 setattr(self, key, value)
 
         def __repr__(self: "RTSDateTime"):
-            vals: list[str] = []
-            for key, value in self._timestamp_map.items():
-                if type(value) is Timestamp:
-                    vals.append(f"{key}={getattr(self, key)}")
+            vals = [f"{key}={getattr(self, key)}" for key in self._schema.settable]
             return f"{self.__class__.__name__}({', '.join(vals)})"
 
         def __str__(self: "RTSDateTime"):
-            vals: list[str] = []
-            for key, value in self._component_map().items():
-                vals.append(f"{key}={getattr(self, key)}")
+            vals = [f"{key}={getattr(self, key)}" for key in self._schema.components]
             return f"{self.__class__.__name__}({', '.join(vals)})"
 
         cls.__init__ = __init__
         cls.__repr__ = __repr__
         cls.__str__ = __str__
+        cls._schema = DateTimeSchema.compile(cls)
 
     @classmethod
     def from_rts_timestamp(cls, rts_timestamp: str):
@@ -106,15 +176,38 @@ class RTSDateTime(object):
             kwargs[name] = float(timestamp)
         return cls(**kwargs)
 
+    @overload
+    @classmethod
+    def iter_from_rts_timestamps(
+        cls,
+        source: "Iterable[str] | os.PathLike | str",
+        *,
+        on_error: "Callable[[RTSTimestampParseError], None] | None" = None,
+        columns: Literal[False] = False,
+        chunk_size: int = 65536,
+    ) -> Iterator[Self]: ...
+
+    @overload
+    @classmethod
+    def iter_from_rts_timestamps(
+        cls,
+        source: "Iterable[str] | os.PathLike | str",
+        *,
+        on_error: "Callable[[RTSTimestampParseError], None] | None" = None,
+        columns: Literal[True],
+        chunk_size: int = 65536,
+    ) -> "Iterator[RTSDateTimeArray[Self]]": ...
+
+    @classmethod
+    def iter_from_rts_timestamps(cls, source, *, on_error=None, columns=False, chunk_size=65536):
+        from .parser import iter_from_rts_timestamps
+
+        return iter_from_rts_timestamps(cls, source, on_error=on_error, columns=columns, chunk_size=chunk_size)
+
     @classmethod
     def _component_map(cls):
-        units_map: dict[str, TimeComponent] = {}
-        vars = cls.__class__.__dict__.copy()
-        vars.update(cls.__dict__)
-        for key, value in vars.items():
-            if isinstance(value, TimeComponent):
-                units_map[key] = value
-        return units_map
+        schema = cls._schema
+        return dict(zip(schema.components, schema.component_fields))
 
     @classmethod
     def dump_json(cls):
@@ -124,45 +217,41 @@ class RTSDateTime(object):
     def load_json(cls, json_string: str):
         if cls is not RTSDateTime:
             raise AttributeError("load_json can only be called on RTSDateTime directly")
+        from .registry import datetime_registry
 
-        class DynRTSDateTime(cls):
-            pass
-
-        new_cls: type[Self] = DynRTSDateTime  # type: ignore
         data = json.loads(json_string)
+        return datetime_registry.get_or_create(data, lambda: cls._build_from_dict(data))
+
+    @classmethod
+    def _build_from_dict(cls, data: dict[str, Any]) -> type[Self]:
+        namespace: dict[str, Any] = {}
         timestamp_map: dict[str, Timestamp] = {}
         for key, value in data.items():
-            new_component, timestamp_map = TimeComponent.construct_from_dict(value, timestamp_map)
-            setattr(new_cls, key, new_component)
-        for key, value in timestamp_map.items():
-            setattr(new_cls, key, value)
-            value.__set_name__(new_cls, key)
+            namespace[key], timestamp_map = TimeComponent.construct_from_dict(value, timestamp_map)
+        namespace.update(timestamp_map)
+        new_cls: type[Self] = RTSDateTimeMeta("DynRTSDateTime", (cls,), namespace)  # type: ignore
         return new_cls
 
     @property
     def _timestamp_map(self):  # -> dict[str, Any]:
-        timestamp_map: dict[str, Timestamp] = {}
-        vars = self.__class__.__dict__.copy()
-        vars.update(self.__dict__)
-        for key, value in vars.items():
-            if isinstance(value, Timestamp):
-                timestamp_map[key] = value
-        return timestamp_map
-
+        schema = self._schema
+        return dict(zip(schema.timestamps, schema.timestamp_fields))
 
     @property
     def timestamp_map(self):
-        return {key: value.__get__(self, self.__class__) for key, value in self._timestamp_map.items()}
+        cls = self.__class__
+        schema = self._schema
+        return {
+            key: value.__get__(self, cls) for key, value in zip(schema.timestamps, schema.timestamp_fields)
+        }
 
     @property
     def units_map(self):
-        units_map: dict[str, RTSTimeUnits] = {}
-        vars = self.__class__.__dict__.copy()
-        vars.update(self.__dict__)
-        for key, value in vars.items():
-            if isinstance(value, TimeComponent):
-                units_map[key] = value.__get__(self, self.__class__)
-        return units_map
+        cls = self.__class__
+        schema = self._schema
+        return {
+            key: value.__get__(self, cls) for key, value in zip(schema.components, schema.component_fields)
+        }
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, RTSDateTime):
@@ -172,6 +261,17 @@ class RTSDateTime(object):
                 return False
         return True
 
+    def format(self, template: str) -> str:
+        from .formatting import format_datetime
+
+        return format_datetime(self, template)
+
+    @classmethod
+    def parse(cls, template: str, text: str) -> Self:
+        from .formatting import parse_datetime
+
+        return parse_datetime(cls, template, text)
+
     def rst_timestamp(self):
         timestamp_strs = []
         for timestamp_name, timestamp in self.timestamp_map.items():
@@ -216,6 +316,9 @@ def rtsdatetime[T](cls: type[T]) -> type[T]:
     return cls
 
 
+RTSDateTime._schema = DateTimeSchema.compile(RTSDateTime)
+
+
 #
 # class RTSTimeComponent[T: RTSTimeUnits](object):
 #
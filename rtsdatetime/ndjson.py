@@ -0,0 +1,140 @@
+import json
+import os
+import warnings
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Self
+
+from .model import RTSDateTime
+from .parser import RTSTimestampParseError
+
+FORMAT_VERSION = 1
+
+
+def _report(error: RTSTimestampParseError):
+    warnings.warn(str(error), RuntimeWarning, stacklevel=3)
+
+
+def _header(datetime_cls: type[RTSDateTime]) -> str:
+    header = {
+        "rtsdatetime": FORMAT_VERSION,
+        "schema": json.loads(datetime_cls.dump_json()),
+        "fields": list(datetime_cls._schema.settable),
+    }
+    return json.dumps(header, separators=(",", ":"))
+
+
+class RTSNDJSONWriter[T: RTSDateTime]:
+    def __init__(self, target: IO[str] | os.PathLike | str, datetime_cls: type[T], buffer_size: int = 1024):
+        if isinstance(target, (str, os.PathLike)):
+            self._stream: IO[str] = open(target, "w")  # noqa: SIM115 - closed by close()
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self._datetime_cls = datetime_cls
+        self._fields = datetime_cls._schema.settable
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = [_header(datetime_cls)]
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, obj: T):
+        if self._closed:
+            raise ValueError("I/O on closed writer")
+        if not isinstance(obj, self._datetime_cls):
+            raise TypeError(f"expected {self._datetime_cls.__name__}, got {type(obj).__name__}")
+        self._buffer.append(self._encode([getattr(obj, name) for name in self._fields]))
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def write_many(self, objects: Iterable[T]):
+        for obj in objects:
+            self.write(obj)
+
+    def flush(self):
+        if self._closed:
+            raise ValueError("I/O on closed writer")
+        if self._buffer:
+            self._stream.write("\n".join(self._buffer))
+            self._stream.write("\n")
+            self._buffer.clear()
+        self._stream.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._owns_stream:
+            self._stream.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
+
+
+def write_ndjson(target: IO[str] | os.PathLike | str, datetime_cls: type[RTSDateTime], objects: Iterable[RTSDateTime]):
+    with RTSNDJSONWriter(target, datetime_cls) as writer:
+        writer.write_many(objects)
+
+
+def _resolve(header_line: str, datetime_cls: type[RTSDateTime] | None) -> tuple[type[RTSDateTime], tuple[str, ...]]:
+    try:
+        header = json.loads(header_line)
+        if header.get("rtsdatetime") != FORMAT_VERSION:
+            raise ValueError(f"unsupported stream version {header.get('rtsdatetime')!r}")
+        fields = tuple(header["fields"])
+        if datetime_cls is None:
+            datetime_cls = RTSDateTime.load_json(json.dumps(header["schema"]))
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise RTSTimestampParseError(1, header_line, f"invalid header ({exc})") from None
+    missing = [name for name in fields if name not in datetime_cls._schema.settable_set]
+    if missing:
+        raise RTSTimestampParseError(1, header_line, f"{datetime_cls.__name__} has no timestamps {missing}")
+    return datetime_cls, fields
+
+
+def iter_ndjson(
+    source: Iterable[str] | os.PathLike | str,
+    datetime_cls: type[RTSDateTime] | None = None,
+    *,
+    on_error: Callable[[RTSTimestampParseError], None] | None = None,
+) -> Iterator[RTSDateTime]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as file:
+            yield from iter_ndjson(file, datetime_cls, on_error=on_error)
+        return
+    on_error = on_error or _report
+    lines = enumerate(source, start=1)
+    for _, header_line in lines:
+        if header_line.strip():
+            break
+    else:
+        return
+    cls, fields = _resolve(header_line.rstrip("\r\n"), datetime_cls)
+    timestamp_fields = cls._schema.timestamp_fields
+    timestamps = cls._schema.timestamps
+    setters = [timestamp_fields[timestamps.index(name)].__set__ for name in fields]
+    width = len(setters)
+    new = cls.__new__
+    decode = json.JSONDecoder().decode
+    for lineno, line in lines:
+        if not line.strip():
+            continue
+        try:
+            values = decode(line)
+            if not isinstance(values, list) or len(values) != width:
+                raise ValueError(f"expected an array of {width} timestamps")
+            obj = new(cls)
+            for setter, value in zip(setters, values):
+                setter(obj, value)
+        except ValueError as exc:
+            on_error(RTSTimestampParseError(lineno, line.rstrip("\r\n"), str(exc)))
+            continue
+        yield obj
@@ -0,0 +1,152 @@
+import os
+import re
+import warnings
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    NamedTuple,
+    overload,
+)
+
+from .model import RTSDateTime, Timestamp
+
+if TYPE_CHECKING:
+    from .array import RTSDateTimeArray
+
+
+class RTSTimestampParseError(ValueError):
+    def __init__(self, lineno: int, line: str, reason: str):
+        super().__init__(f"line {lineno}: {reason}: {line!r}")
+        self.lineno = lineno
+        self.line = line
+        self.reason = reason
+
+
+class _LineLayout(NamedTuple):
+    patterns: tuple[re.Pattern[str], ...]
+    fields: tuple[Timestamp, ...]
+    field_index: dict[str, int]
+    read_only: frozenset[str]
+
+
+_layouts: "weakref.WeakKeyDictionary[type[RTSDateTime], _LineLayout]" = weakref.WeakKeyDictionary()
+
+
+def _compile_pattern(names: tuple[str, ...], settable: frozenset[str]) -> re.Pattern[str]:
+    parts = [
+        f"{re.escape(name)}=([^,=]*)" if name in settable else f"{re.escape(name)}=(?:[^,=]*)" for name in names
+    ]
+    return re.compile(",".join(parts))
+
+
+def _layout(datetime_cls: type[RTSDateTime]) -> _LineLayout:
+    layout = _layouts.get(datetime_cls)
+    if layout is None:
+        schema = datetime_cls._schema
+        patterns = [_compile_pattern(schema.timestamps, schema.settable_set)]
+        if schema.settable != schema.timestamps:
+            patterns.append(_compile_pattern(schema.settable, schema.settable_set))
+        fields = tuple(schema.timestamp_fields[schema.timestamps.index(name)] for name in schema.settable)
+        layout = _LineLayout(
+            patterns=tuple(patterns),
+            fields=fields,
+            field_index={name: index for index, name in enumerate(schema.settable)},
+            read_only=frozenset(schema.timestamps) - schema.settable_set,
+        )
+        _layouts[datetime_cls] = layout
+    return layout
+
+
+def _parse_line(layout: _LineLayout, line: str) -> list[float]:
+    for pattern in layout.patterns:
+        match = pattern.fullmatch(line)
+        if match is not None:
+            return [float(value) for value in match.groups()]
+    values = [0.0] * len(layout.fields)
+    for part in line.split(","):
+        name, separator, value = part.partition("=")
+        if not separator or "=" in value:
+            raise ValueError(f"malformed field '{part}'")
+        if name in layout.read_only:
+            continue
+        index = layout.field_index.get(name)
+        if index is None:
+            raise ValueError(f"unknown timestamp '{name}'")
+        values[index] = float(value)
+    return values
+
+
+def _report(error: RTSTimestampParseError):
+    warnings.warn(str(error), RuntimeWarning, stacklevel=3)
+
+
+def _iter_values(
+    layout: _LineLayout, source: Iterable[str], on_error: Callable[[RTSTimestampParseError], None]
+) -> Iterator[list[float]]:
+    for lineno, line in enumerate(source, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        try:
+            yield _parse_line(layout, line)
+        except ValueError as exc:
+            on_error(RTSTimestampParseError(lineno, line, str(exc)))
+
+
+@overload
+def iter_from_rts_timestamps[T: RTSDateTime](
+    datetime_cls: type[T],
+    source: Iterable[str] | os.PathLike | str,
+    *,
+    on_error: Callable[[RTSTimestampParseError], None] | None = None,
+    columns: Literal[False] = False,
+    chunk_size: int = 65536,
+) -> Iterator[T]: ...
+
+
+@overload
+def iter_from_rts_timestamps[T: RTSDateTime](
+    datetime_cls: type[T],
+    source: Iterable[str] | os.PathLike | str,
+    *,
+    on_error: Callable[[RTSTimestampParseError], None] | None = None,
+    columns: Literal[True],
+    chunk_size: int = 65536,
+) -> "Iterator[RTSDateTimeArray[T]]": ...
+
+
+def iter_from_rts_timestamps(datetime_cls, source, *, on_error=None, columns=False, chunk_size=65536):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as file:
+            yield from iter_from_rts_timestamps(
+                datetime_cls, file, on_error=on_error, columns=columns, chunk_size=chunk_size
+            )
+        return
+    layout = _layout(datetime_cls)
+    values_iter = _iter_values(layout, source, on_error or _report)
+    if columns:
+        yield from _iter_chunks(datetime_cls, layout, values_iter, chunk_size)
+        return
+    fields = layout.fields
+    new = datetime_cls.__new__
+    for values in values_iter:
+        obj = new(datetime_cls)
+        for field, value in zip(fields, values):
+            field.__set__(obj, value)
+        yield obj
+
+
+def _iter_chunks(datetime_cls: type[RTSDateTime], layout: _LineLayout, values_iter: Iterator[list[float]], chunk_size: int):
+    from .array import RTSDateTimeArray
+
+    names = datetime_cls._schema.settable
+    rows: list[list[float]] = []
+    for values in values_iter:
+        rows.append(values)
+        if len(rows) >= chunk_size:
+            yield RTSDateTimeArray(datetime_cls, dict(zip(names, zip(*rows))))
+            rows = []
+    if rows:
+        yield RTSDateTimeArray(datetime_cls, dict(zip(names, zip(*rows))))
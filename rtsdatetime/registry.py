@@ -0,0 +1,61 @@
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class RegistryStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+def schema_hash(data: Any) -> str:
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SchemaRegistry[T]:
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+        self._classes: weakref.WeakValueDictionary[str, T] = weakref.WeakValueDictionary()
+        self._recent: OrderedDict[str, T] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(self, data: Any, factory: Callable[[], T]) -> T:
+        key = schema_hash(data)
+        with self._lock:
+            value = self._classes.get(key)
+            if value is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+                value = factory()
+                self._classes[key] = value
+            self._recent[key] = value
+            self._recent.move_to_end(key)
+            while len(self._recent) > self.maxsize:
+                self._recent.popitem(last=False)
+                self._evictions += 1
+            return value
+
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            return RegistryStats(self._hits, self._misses, self._evictions, len(self._classes))
+
+    def clear(self):
+        with self._lock:
+            self._classes.clear()
+            self._recent.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+units_registry: SchemaRegistry[type] = SchemaRegistry()
+datetime_registry: SchemaRegistry[type] = SchemaRegistry()
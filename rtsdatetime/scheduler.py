@@ -0,0 +1,163 @@
+import asyncio
+import contextlib
+import heapq
+import inspect
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from .units import RTSTimeUnits
+
+
+def _unit_length(units: type[RTSTimeUnits], unit: str) -> float:
+    schema = units._schema
+    if schema.seconds_ratio is None:
+        raise AttributeError(f"{units.__name__} must have a seconds_ratio attribute")
+    if unit not in schema.name_set:
+        raise ValueError(f"{units.__name__} has no unit '{unit}'")
+    return schema.lengths[schema.positions[unit]]
+
+
+def _next_boundary(units: type[RTSTimeUnits], unit: str, after: float | None = None) -> tuple[float, float]:
+    length = _unit_length(units, unit)
+    schema = units._schema
+    ratio: float = schema.seconds_ratio  # type: ignore[assignment]
+    epoch = schema.epoch_timestamp
+    if after is None:
+        after = time.time()
+    boundary = (math.floor((after - epoch) * ratio / length) + 1) * length
+    target = boundary / ratio + epoch
+    while (target - epoch) * ratio < boundary or target <= after:
+        target = math.nextafter(target, math.inf)
+    return boundary, target
+
+
+def next_boundary_timestamp(units: type[RTSTimeUnits], unit: str, after: float | None = None) -> float:
+    return _next_boundary(units, unit, after)[1]
+
+
+async def sleep_until(target: float):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (target - time.time())
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(remaining)
+
+
+async def next_boundary[T: RTSTimeUnits](units: type[T], unit: str) -> T:
+    boundary, target = _next_boundary(units, unit)
+    await sleep_until(target)
+    return units.from_timestamp(boundary)
+
+
+async def ticks[T: RTSTimeUnits](units: type[T], unit: str, skip_missed: bool = True) -> AsyncIterator[T]:
+    boundary, target = _next_boundary(units, unit)
+    while True:
+        await sleep_until(target)
+        yield units.from_timestamp(boundary)
+        after = max(target, time.time()) if skip_missed else target
+        boundary, target = _next_boundary(units, unit, after)
+
+
+class _Group:
+    __slots__ = ("callbacks", "scheduled", "unit", "units")
+
+    def __init__(self, units: type[RTSTimeUnits], unit: str):
+        self.units = units
+        self.unit = unit
+        self.callbacks: dict[int, Callable[[Any], Any]] = {}
+        self.scheduled = False
+
+
+class Registration:
+    __slots__ = ("_id", "_key", "_scheduler")
+
+    def __init__(self, scheduler: "BoundaryScheduler", key: tuple[type[RTSTimeUnits], str], registration_id: int):
+        self._scheduler = scheduler
+        self._key = key
+        self._id = registration_id
+
+    def cancel(self):
+        group = self._scheduler._groups.get(self._key)
+        if group is not None:
+            group.callbacks.pop(self._id, None)
+
+
+class BoundaryScheduler:
+    def __init__(self, wall_clock: Callable[[], float] = time.time) -> None:
+        self._groups: dict[tuple[type[RTSTimeUnits], str], _Group] = {}
+        self._heap: list[tuple[float, int, float, _Group]] = []
+        self._ids = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._running = False
+        self._wall_clock = wall_clock
+        self._tasks: set[asyncio.Future[Any]] = set()
+
+    def register(self, units: type[RTSTimeUnits], unit: str, callback: Callable[[Any], Any]) -> Registration:
+        key = (units, unit)
+        group = self._groups.get(key)
+        if group is None:
+            _unit_length(units, unit)
+            group = self._groups[key] = _Group(units, unit)
+        registration_id = next(self._ids)
+        if not group.scheduled:
+            boundary, target = _next_boundary(units, unit, self._wall_clock())
+            heapq.heappush(self._heap, (target, registration_id, boundary, group))
+            group.scheduled = True
+            if self._wakeup is not None:
+                self._wakeup.set()
+        group.callbacks[registration_id] = callback
+        return Registration(self, key, registration_id)
+
+    def __len__(self) -> int:
+        return sum(len(group.callbacks) for group in self._groups.values())
+
+    def stop(self):
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                heap = self._heap
+                while heap and not heap[0][3].callbacks:
+                    group = heapq.heappop(heap)[3]
+                    group.scheduled = False
+                    if self._groups.get((group.units, group.unit)) is group:
+                        del self._groups[(group.units, group.unit)]
+                # targets are wall-clock times read afresh on every wakeup, so wall-clock adjustments are
+                # picked up; the sleeps themselves run on the loop's monotonic clock
+                now = self._wall_clock()
+                timeout = heap[0][0] - now if heap else None
+                if timeout is None or timeout > 0:
+                    wakeup.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(wakeup.wait(), timeout)
+                    continue
+                target, _, boundary, group = heapq.heappop(heap)
+                self._dispatch(loop, group, group.units.from_timestamp(boundary))
+                boundary, target = _next_boundary(group.units, group.unit, max(target, now))
+                heapq.heappush(heap, (target, next(self._ids), boundary, group))
+        finally:
+            self._wakeup = None
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, group: _Group, units: RTSTimeUnits):
+        for callback in list(group.callbacks.values()):
+            try:
+                result = callback(units)
+                if inspect.isawaitable(result):
+                    task: asyncio.Future[Any] = asyncio.ensure_future(result, loop=loop)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            except Exception as exc:  # noqa: BLE001 - reported through the loop, like asyncio callbacks
+                loop.call_exception_handler(
+                    {"message": "BoundaryScheduler callback failed", "exception": exc, "callback": callback}
+                )
@@ -0,0 +1,134 @@
+import math
+import weakref
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .units import absolute_unit_value, visual_unit_value
+from .vectorized import UnitArrays, _numpy, decompose_unit
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+MICROSECONDS = 1_000_000
+MAX_DENOMINATOR = 1_000_000
+INT64_LIMIT = 2**63
+
+
+class TickSchema(NamedTuple):
+    resolution: int
+    numerator: int
+    denominator: int
+    epoch_us: int
+    names: tuple[str, ...]
+    unit_ticks: tuple[int, ...]
+    wraps: tuple[int, ...]
+
+    @classmethod
+    def compile(cls, time_units: type["RTSTimeUnits"]) -> "TickSchema":
+        schema = time_units._schema
+        if schema.seconds_ratio is None:
+            raise AttributeError(f"{time_units.__name__} must have a seconds_ratio attribute")
+        resolution = time_units.tick_resolution
+        ratio = Fraction(schema.seconds_ratio).limit_denominator(MAX_DENOMINATOR) * resolution
+        unit_ticks = []
+        for name, length in zip(schema.names, schema.lengths):
+            ticks = Fraction(length) * resolution
+            if ticks.denominator != 1:
+                raise ValueError(
+                    f"{time_units.__name__}.{name} length {length} is not a whole number of ticks "
+                    f"at tick_resolution {resolution}"
+                )
+            unit_ticks.append(int(ticks))
+        return cls(
+            resolution=resolution,
+            numerator=ratio.numerator,
+            denominator=ratio.denominator * MICROSECONDS,
+            epoch_us=round(schema.epoch_timestamp * MICROSECONDS),
+            names=schema.names,
+            unit_ticks=tuple(unit_ticks),
+            wraps=schema.wraps,
+        )
+
+
+_schemas: "weakref.WeakKeyDictionary[type[RTSTimeUnits], TickSchema]" = weakref.WeakKeyDictionary()
+
+
+def tick_schema(time_units: type["RTSTimeUnits"]) -> TickSchema:
+    schema = _schemas.get(time_units)
+    if schema is None:
+        schema = _schemas[time_units] = TickSchema.compile(time_units)
+    return schema
+
+
+class RTSTicks(NamedTuple):
+    time_units: type["RTSTimeUnits"]
+    ticks: int
+
+    @classmethod
+    def from_utc_timestamp(cls, time_units: type["RTSTimeUnits"], timestamp: float) -> "RTSTicks":
+        schema = tick_schema(time_units)
+        microseconds = round(timestamp * MICROSECONDS) - schema.epoch_us
+        return cls(time_units, microseconds * schema.numerator // schema.denominator)
+
+    @classmethod
+    def from_units(cls, units: "RTSTimeUnits") -> "RTSTicks":
+        schema = tick_schema(type(units))
+        return cls(type(units), math.floor(Fraction(units.timestamp) * schema.resolution))
+
+    def to_utc_timestamp(self) -> float:
+        schema = tick_schema(self.time_units)
+        return (schema.epoch_us * schema.numerator + self.ticks * schema.denominator) / (
+            schema.numerator * MICROSECONDS
+        )
+
+    def to_units(self) -> "RTSTimeUnits":
+        return self.time_units.from_timestamp(self.ticks / tick_schema(self.time_units).resolution)
+
+    def absolute_unit(self, name: str) -> int:
+        schema = tick_schema(self.time_units)
+        index = schema.names.index(name)
+        return absolute_unit_value(self.ticks, schema.unit_ticks[index], schema.wraps[index])
+
+    def visual_unit(self, name: str) -> int:
+        schema = tick_schema(self.time_units)
+        index = schema.names.index(name)
+        return visual_unit_value(self.ticks, schema.unit_ticks[index], schema.wraps[index])
+
+    def visual_units(self) -> dict[str, int]:
+        schema = tick_schema(self.time_units)
+        return {
+            name: visual_unit_value(self.ticks, length, wrap)
+            for name, length, wrap in zip(schema.names, schema.unit_ticks, schema.wraps)
+        }
+
+
+def ticks_from_utc(time_units: type["RTSTimeUnits"], timestamps: Any):
+    np = _numpy()
+    schema = tick_schema(time_units)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if timestamps.ndim != 1:
+        raise ValueError(f"expected a 1-D array of timestamps, got {timestamps.ndim} dimensions")
+    microseconds = np.rint(timestamps * MICROSECONDS).astype(np.int64) - schema.epoch_us
+    if not microseconds.size or int(np.abs(microseconds).max()) * schema.numerator < INT64_LIMIT:
+        return microseconds * schema.numerator // schema.denominator
+    ticks = microseconds.astype(object) * schema.numerator // schema.denominator
+    if max(map(abs, ticks)) >= INT64_LIMIT:
+        raise OverflowError(f"ticks for {time_units.__name__} do not fit in int64")
+    return ticks.astype(np.int64)
+
+
+def ticks_to_utc(time_units: type["RTSTimeUnits"], ticks: Any):
+    np = _numpy()
+    schema = tick_schema(time_units)
+    ticks = np.asarray(ticks, dtype=np.int64)
+    return schema.epoch_us / MICROSECONDS + ticks * (schema.denominator / schema.numerator / MICROSECONDS)
+
+
+def decompose_ticks(time_units: type["RTSTimeUnits"], ticks: Any) -> dict[str, UnitArrays]:
+    np = _numpy()
+    schema = tick_schema(time_units)
+    ticks = np.asarray(ticks, dtype=np.int64)
+    return {
+        name: decompose_unit(ticks, length, wrap)
+        for name, length, wrap in zip(schema.names, schema.unit_ticks, schema.wraps)
+    }
@@ -0,0 +1,144 @@
+import bisect
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Self
+
+from .model import RTSDateTime
+
+if TYPE_CHECKING:
+    from .array import RTSDateTimeArray
+    from .units import RTSTimeUnits
+
+
+class RTSTimeline[T: RTSDateTime]:
+    def __init__(
+        self,
+        datetime_cls: type[T],
+        field: str,
+        time_units: type["RTSTimeUnits"] | None = None,
+    ):
+        schema = datetime_cls._schema
+        if field not in schema.timestamps:
+            raise ValueError(f"Unknown timestamp '{field}'")
+        if time_units is None:
+            for component in schema.component_fields:
+                if component.timestamp.name == field:
+                    time_units = component.units
+                    break
+            else:
+                raise ValueError(f"no TimeComponent uses '{field}', pass time_units explicitly")
+        self._datetime_cls = datetime_cls
+        self._field = field
+        self._time_units: type[RTSTimeUnits] = time_units
+        self._timestamps = array("d")
+        self._ids = array("q")
+        self._next_id = 0
+
+    @classmethod
+    def from_objects(
+        cls,
+        datetime_cls: type[T],
+        field: str,
+        objects: Iterable[T],
+        time_units: type["RTSTimeUnits"] | None = None,
+    ) -> "RTSTimeline[T]":
+        timeline = cls(datetime_cls, field, time_units)
+        timeline._load(getattr(obj, field) for obj in objects)
+        return timeline
+
+    @classmethod
+    def from_array(
+        cls,
+        records: "RTSDateTimeArray[T]",
+        field: str,
+        time_units: type["RTSTimeUnits"] | None = None,
+    ) -> "RTSTimeline[T]":
+        timeline = cls(records.datetime_cls, field, time_units)
+        timeline._load(records.column(field).tolist())
+        return timeline
+
+    def _load(self, timestamps: Iterable[float]):
+        values = array("d", timestamps)
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self._timestamps = array("d", (values[index] for index in order))
+        self._ids = array("q", order)
+        self._next_id = len(values)
+
+    def _empty(self) -> Self:
+        return self.__class__(self._datetime_cls, self._field, self._time_units)
+
+    @property
+    def field(self) -> str:
+        return self._field
+
+    @property
+    def time_units(self) -> type["RTSTimeUnits"]:
+        return self._time_units
+
+    @property
+    def timestamps(self) -> array:
+        return self._timestamps
+
+    def insert(self, obj: T | float, id: int | None = None) -> int:
+        timestamp = obj if isinstance(obj, (int, float)) else getattr(obj, self._field)
+        if id is None:
+            id = self._next_id
+        elif id < self._next_id and id in self._ids:
+            raise ValueError(f"id {id} is already in the timeline")
+        self._next_id = max(self._next_id, id + 1)
+        index = bisect.bisect_right(self._timestamps, timestamp)
+        self._timestamps.insert(index, timestamp)
+        self._ids.insert(index, id)
+        return id
+
+    def merge(self, other: "RTSTimeline[T]", renumber: bool = False) -> "RTSTimeline[T]":
+        if (other._datetime_cls, other._field, other._time_units) != (
+            self._datetime_cls,
+            self._field,
+            self._time_units,
+        ):
+            raise ValueError("can only merge timelines over the same class, field and units")
+        other_ids: Iterable[int] = other._ids
+        if renumber:
+            other_ids = (id + self._next_id for id in other._ids)
+        elif not set(self._ids).isdisjoint(other._ids):
+            raise ValueError("timelines share ids, pass renumber=True to offset the other timeline's ids")
+        merged = self._empty()
+        pairs = heapq.merge(zip(self._timestamps, self._ids), zip(other._timestamps, other_ids))
+        for timestamp, id in pairs:
+            merged._timestamps.append(timestamp)
+            merged._ids.append(id)
+        merged._next_id = self._next_id + other._next_id if renumber else max(self._next_id, other._next_id)
+        return merged
+
+    def bounds(self, start: float, stop: float) -> tuple[int, int]:
+        timestamps = self._timestamps
+        return bisect.bisect_left(timestamps, start), bisect.bisect_left(timestamps, stop)
+
+    def unit_bounds(self, **units: int) -> tuple[int, int]:
+        return self.bounds(*self._time_units.utc_span(**units))
+
+    def between(self, start: float, stop: float) -> Iterator[int]:
+        low, high = self.bounds(start, stop)
+        return iter(self._ids[low:high])
+
+    def select(self, **units: int) -> Iterator[int]:
+        low, high = self.unit_bounds(**units)
+        return iter(self._ids[low:high])
+
+    def count(self, **units: int) -> int:
+        low, high = self.unit_bounds(**units)
+        return high - low
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def items(self) -> Iterator[tuple[float, int]]:
+        return zip(self._timestamps, self._ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._datetime_cls.__name__}.{self._field}, length={len(self)})"
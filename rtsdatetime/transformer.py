@@ -1,25 +1,117 @@
 import datetime
-from rtsdatetime.model import Timestamp, RTSDateTime, RTSTimeUnits
-from typing import Any, Callable
+from collections.abc import Callable
+from typing import Any
+
 from rtsdatetime.default_units import StandardUnits
+from rtsdatetime.model import RTSDateTime, Timestamp
+
+
+class TransformerChain:
+    __slots__ = ("affine", "batch", "root", "scalar")
+
+    def __init__(
+        self,
+        root: Timestamp,
+        scalar: Callable[[float], float],
+        batch: Callable[[Any], Any] | None,
+        affine: tuple[float, float] | None,
+    ):
+        self.root = root
+        self.scalar = scalar
+        self.batch = batch
+        self.affine = affine
+
+
+def _affine_scalar(scale: float, offset: float) -> Callable[[float], float]:
+    return lambda timestamp: timestamp * scale + offset
 
 
 class TimestampTransformer(Timestamp):
-    def __init__(self, base: Timestamp, transformer: Callable[[float], float] | None = None):
+    settable = False
+    affine: tuple[float, float] | None = None
+    batch_transformer: Callable[[Any], Any] | None = None
+
+    def __init__(
+        self,
+        base: Timestamp,
+        transformer: Callable[[float], float] | None = None,
+        *,
+        batch: Callable[[Any], Any] | None = None,
+        affine: tuple[float, float] | None = None,
+    ):
         self.base = base
+        if transformer is None and affine is None:
+            affine = self.affine
+            batch = batch or self.batch_transformer
+        self.affine_form = affine
+        if transformer is None and affine is not None:
+            transformer = _affine_scalar(*affine)
+            batch = batch or transformer
         self.transformer_cb = transformer or self.transformer
+        self.batch_cb = batch
+        self._chain: TransformerChain | None = None
 
     def __set_name__(self, owner: type[RTSDateTime], name: str):
         self.name = name
 
+    def compile(self) -> TransformerChain:
+        if self._chain is not None:
+            return self._chain
+        base = self.base
+        if not isinstance(base, TimestampTransformer):
+            chain = TransformerChain(base, self.transformer_cb, self.batch_cb, self.affine_form)
+        else:
+            base_chain = base.compile()
+            if base_chain.affine is not None and self.affine_form is not None:
+                base_scale, base_offset = base_chain.affine
+                scale, offset = self.affine_form
+                affine = (base_scale * scale, base_offset * scale + offset)
+                scalar = _affine_scalar(*affine)
+                chain = TransformerChain(base_chain.root, scalar, scalar, affine)
+            else:
+                base_scalar, base_batch = base_chain.scalar, base_chain.batch
+                transformer_cb, batch_cb = self.transformer_cb, self.batch_cb
+                batch = None
+                if base_batch is not None and batch_cb is not None:
+                    batch = lambda timestamps: batch_cb(base_batch(timestamps))
+                chain = TransformerChain(
+                    base_chain.root, lambda timestamp: transformer_cb(base_scalar(timestamp)), batch, None
+                )
+        self._chain = chain
+        return chain
+
     def __get__(self, obj: "RTSDateTime | None", objtype: type[RTSDateTime] | None = None) -> float:
         if obj is None or not issubclass(objtype, RTSDateTime):
             raise AttributeError("TimestampTransformer can only be accessed through RTSDateTime objects")
-        return self.transformer_cb(self.base.__get__(obj, objtype))
+        chain = self._chain or self.compile()
+        base_value = chain.root.__get__(obj, objtype)
+        if chain.affine is not None:
+            scale, offset = chain.affine
+            return base_value * scale + offset
+        try:
+            cache = obj._transform_cache
+        except AttributeError:
+            cache = obj._transform_cache = {}
+        entry = cache.get(self)
+        if entry is not None and entry[0] == base_value:
+            return entry[1]
+        value = chain.scalar(base_value)
+        cache[self] = (base_value, value)
+        return value
 
     def __set__(self, obj: "RTSDateTime", value: Any):
         raise AttributeError("TimestampTransformer is read-only")
 
+    def transform_batch(self, timestamps: Any) -> Any:
+        from .vectorized import _numpy
+
+        np = _numpy()
+        chain = self._chain or self.compile()
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if chain.batch is not None:
+            return np.asarray(chain.batch(timestamps), dtype=np.float64)
+        return np.fromiter(map(chain.scalar, timestamps.tolist()), dtype=np.float64, count=len(timestamps))
+
     @staticmethod
     def transformer(timestamp: float) -> float:
         raise NotImplementedError(
@@ -27,8 +119,12 @@ class TimestampTransformer(Timestamp):
         )
 
 
+_STANDARD_LENGTHS = tuple(StandardUnits.unit_map()[name].length for name in ("year", "day", "hour", "minute", "second"))
+
+
 class SUTimestampTransformer(TimestampTransformer):
     @staticmethod
     def transformer(timestamp: float) -> float:
         dt = datetime.datetime.fromtimestamp(timestamp)
-        return StandardUnits(year=dt.year, day=dt.day, hour=dt.hour, minute=dt.minute, second=dt.second).timestamp
+        year, day, hour, minute, second = _STANDARD_LENGTHS
+        return dt.year * year + dt.day * day + dt.hour * hour + dt.minute * minute + dt.second * second
@@ -1,10 +1,82 @@
-from dataclasses import InitVar, dataclass
 import datetime
-import json
-from typing import Any, Self, dataclass_transform
+import math
+from collections.abc import Iterable, Iterator, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    NamedTuple,
+    Self,
+    dataclass_transform,
+)
+
+from .codegen import decomposer
+
+
+class SlotsMeta(type):
+    def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], slots: bool = False, **kwargs: Any):
+        if slots and "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(mcls._generate_slots(bases, namespace))
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], slots: bool = False, **kwargs: Any):
+        super().__init__(name, bases, namespace, **kwargs)
+
+    @classmethod
+    def _generate_slots(mcls, bases: tuple[type, ...], namespace: dict[str, Any]) -> Iterable[str]:
+        return ()
+
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_fixed_offsets: dict[datetime.tzinfo, int] = {}
+
+
+def _utc_offset(dt: datetime.datetime, tzinfo: datetime.tzinfo) -> int:
+    offset = _fixed_offsets.get(tzinfo)
+    if offset is not None:
+        return offset
+    delta = dt.utcoffset()
+    if delta is None:
+        raise ValueError(f"{tzinfo!r} returned no utcoffset for {dt!r}")
+    offset = delta // _MICROSECOND
+    if isinstance(tzinfo, datetime.timezone):
+        _fixed_offsets[tzinfo] = offset
+    return offset
+
+
+def utc_timestamp(dt: datetime.datetime, assume_utc: bool = False) -> float:
+    tzinfo = dt.tzinfo
+    if tzinfo is None:
+        if not assume_utc:
+            return dt.timestamp()
+        offset = 0
+    else:
+        offset = _utc_offset(dt, tzinfo)
+    seconds = (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return (seconds * 1_000_000 + dt.microsecond - offset) / 1_000_000
+
+
+def absolute_unit_value(timestamp: float, length: float, wrap: int) -> int:
+    if wrap:
+        unit = int(timestamp // length % wrap)
+    else:
+        unit = int(timestamp // length)
+    if timestamp < 0:
+        return -unit
+    return unit
+
+
+def visual_unit_value(timestamp: float, length: float, wrap: int) -> int:
+    unit = absolute_unit_value(timestamp, length, wrap)
+    if unit < 0:
+        return (wrap - 1) + unit
+    return unit
 
 
 class GeneratedRSTUnit:
+    __slots__ = ("length", "timestamp", "wrap")
+
     def __init__(self, timestamp: float, length: float, wrap: int):
         self.length = length
         self.timestamp = timestamp
@@ -27,7 +99,6 @@ class GeneratedRSTUnit:
     def visual_unit(self):
         absolute_unit = self._absolute_unit(self.timestamp)
         if absolute_unit < 0:
-            print(absolute_unit)
             return  ((self.wrap-1) + absolute_unit)
         return absolute_unit
 
@@ -37,24 +108,128 @@ class GeneratedRSTUnit:
     def __str__(self):
         return f"{self.visual_unit}"
 
+
+class UnitSchema(NamedTuple):
+    names: tuple[str, ...]
+    positions: dict[str, int]
+    units: tuple["RTSUnit", ...]
+    lengths: tuple[float, ...]
+    wraps: tuple[int, ...]
+    name_set: frozenset[str]
+    seconds_ratio: float | None
+    epoch_timestamp: float
+
+    @classmethod
+    def compile(cls, time_units: type["RTSTimeUnits"]) -> "UnitSchema":
+        unit_map: dict[str, RTSUnit] = {}
+        for klass in reversed(time_units.__mro__):
+            for key, value in vars(klass).items():
+                if isinstance(value, RTSUnit):
+                    unit_map[key] = value
+                elif key in unit_map:
+                    del unit_map[key]
+        units = tuple(unit_map.values())
+        return cls(
+            names=tuple(unit_map),
+            positions={name: index for index, name in enumerate(unit_map)},
+            units=units,
+            lengths=tuple(unit.length for unit in units),
+            wraps=tuple(unit.wrap for unit in units),
+            name_set=frozenset(unit_map),
+            seconds_ratio=time_units.seconds_ratio,
+            epoch_timestamp=utc_timestamp(time_units.epoch),
+        )
+
+
+class _LazyUnitSchema:
+    def __get__(self, obj: "RTSTimeUnits | None", objtype: "type[RTSTimeUnits] | None" = None) -> UnitSchema:
+        owner: type[RTSTimeUnits] = objtype if objtype is not None else type(obj)  # type: ignore[assignment]
+        schema = UnitSchema.compile(owner)
+        owner._schema = schema
+        return schema
+
+
+_lazy_schema = _LazyUnitSchema()
+
+
+class UnitsView(Mapping[str, GeneratedRSTUnit]):
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "RTSTimeUnits"):
+        self._owner = owner
+
+    def _cache(self) -> tuple[float, dict[str, GeneratedRSTUnit], dict[str, int]]:
+        owner = self._owner
+        timestamp = owner.timestamp
+        try:
+            cache = owner._unit_cache
+        except AttributeError:
+            cache = None
+        if cache is None or cache[0] != timestamp:
+            cache = owner._unit_cache = (timestamp, {}, {})
+        return cache
+
+    def __getitem__(self, name: str) -> GeneratedRSTUnit:
+        timestamp, units, _ = self._cache()
+        unit = units.get(name)
+        if unit is None:
+            schema = self._owner._schema
+            index = schema.positions[name]
+            unit = units[name] = GeneratedRSTUnit(timestamp, schema.lengths[index], schema.wraps[index])
+        return unit
+
+    def visual_unit(self, name: str) -> int:
+        timestamp, _, visuals = self._cache()
+        value = visuals.get(name)
+        if value is None:
+            schema = self._owner._schema
+            index = schema.positions[name]
+            value = visuals[name] = visual_unit_value(timestamp, schema.lengths[index], schema.wraps[index])
+        return value
+
+    def visual_units(self) -> dict[str, int]:
+        owner = self._owner
+        return dict(zip(owner._schema.names, decomposer(type(owner))(owner.timestamp)))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner._schema.names)
+
+    def __len__(self) -> int:
+        return len(self._owner._schema.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._owner._schema.name_set
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._owner!r})"
+
+
 @dataclass_transform(kw_only_default=True)
-class RTSTimeUnits:
-    timestamp: float = 0
+class RTSTimeUnits(metaclass=SlotsMeta):
+    if TYPE_CHECKING:
+        timestamp: float = 0
+        _unit_cache: tuple[float, dict[str, GeneratedRSTUnit], dict[str, int]] | None = None
+    else:
+        __slots__ = ("_unit_cache", "timestamp")
     seconds_ratio: None | float = None
     epoch: datetime.datetime = datetime.datetime(1970, 1, 1)
+    tick_resolution: int = 1
+    _schema: ClassVar[UnitSchema]
 
     def __init_subclass__(cls: type["RTSTimeUnits"]) -> None:
         if cls.seconds_ratio is None:
             raise AttributeError(f"{cls.__name__} must have a seconds_ratio attribute")
 
         def __init__(self: "RTSTimeUnits", **kwargs):
+            name_set = self._schema.name_set
+            self.timestamp = 0
             for unit_name, unit_value in kwargs.items():
-                if getattr(self, unit_name, None) is None:
+                if unit_name not in name_set and unit_name != "timestamp":
                     raise TypeError(f"{self.__class__.__name__} has no keyword argument {unit_name}")
                 setattr(self, unit_name, unit_value)
 
         def __str__(self: "RTSTimeUnits"):
-            components  = [f"{unit_name}={unit_value.visual_unit}" for unit_name, unit_value in self.units.items()]
+            components = [f"{unit_name}={unit_value}" for unit_name, unit_value in self.units.visual_units().items()]
             return f"{self.__class__.__name__}({', '.join(components)})"
 
         def __repr__(self: "RTSTimeUnits"):
@@ -63,6 +238,7 @@ class RTSTimeUnits:
         cls.__repr__ = __repr__
         cls.__str__ = __str__
         cls.__init__ = __init__
+        cls._schema = _lazy_schema  # type: ignore[assignment]
 
     @classmethod
     def from_seconds(cls, seconds: float):
@@ -74,11 +250,104 @@ class RTSTimeUnits:
 
     @classmethod
     def from_datetime(cls, dt: datetime.datetime):
-        return cls.from_utc_timestamp(dt.timestamp())
+        return cls.from_utc_timestamp(utc_timestamp(dt))
+
+    @classmethod
+    def from_datetimes(cls, datetimes: Iterable[datetime.datetime], assume_utc: bool = False):
+        from .vectorized import _unit_timestamps, utc_timestamps
+
+        return _unit_timestamps(cls, utc_timestamps(datetimes, assume_utc))
 
     @classmethod
     def from_utc_timestamp(cls, timestamp: float):
-        return cls.from_seconds(timestamp - cls.epoch.timestamp())
+        return cls.from_seconds(timestamp - cls._schema.epoch_timestamp)
+
+    @classmethod
+    def decompose(cls, timestamps: Any):
+        from .vectorized import decompose
+
+        return decompose(cls, timestamps)
+
+    @classmethod
+    def compose(cls, **columns: Any):
+        from .vectorized import compose
+
+        return compose(cls, columns)
+
+    @classmethod
+    def bucket_utc_timestamps(cls, timestamps: Any, unit: str, wrapped: bool = False):
+        from .vectorized import bucket_utc_timestamps
+
+        return bucket_utc_timestamps(cls, timestamps, unit, wrapped)
+
+    @classmethod
+    def range(
+        cls, start: "RTSTimeUnits | float", stop: "RTSTimeUnits | float", unit: str, step: int = 1
+    ) -> Iterator[Self]:
+        index = cls._schema.positions.get(unit)
+        if index is None:
+            raise TypeError(f"{cls.__name__} has no unit {unit}")
+        if step == 0:
+            raise ValueError("range step must not be zero")
+        length = cls._schema.lengths[index]
+        start = start.timestamp if isinstance(start, RTSTimeUnits) else start
+        stop = stop.timestamp if isinstance(stop, RTSTimeUnits) else stop
+        align = math.ceil if step > 0 else math.floor
+        boundaries = range(align(start / length), align(stop / length), step)
+        return (cls.from_timestamp(boundary * length) for boundary in boundaries)
+
+    def to_utc_timestamp(self) -> float:
+        if self.seconds_ratio is None:
+            raise AttributeError(f"{self.__class__.__name__} must have a seconds_ratio attribute")
+        return self.timestamp / self.seconds_ratio + self._schema.epoch_timestamp
+
+    @classmethod
+    def utc_span(cls, **units: int) -> tuple[float, float]:
+        if not units:
+            raise TypeError("utc_span requires at least one unit")
+        if cls.seconds_ratio is None:
+            raise AttributeError(f"{cls.__name__} must have a seconds_ratio attribute")
+        from .formatting import compose_unit_values
+
+        schema = cls._schema
+        length: float | None = None
+        for unit_name, unit_value in units.items():
+            index = schema.positions.get(unit_name)
+            if index is None:
+                raise TypeError(f"{cls.__name__} has no unit {unit_name}")
+            wrap = schema.wraps[index]
+            if wrap and not 0 <= unit_value < wrap:
+                raise ValueError(f"{unit_name} must be in range(0, {wrap}), got {unit_value}")
+            if length is None or schema.lengths[index] < length:
+                length = schema.lengths[index]
+        assert length is not None
+        if all(schema.wraps[schema.positions[name]] for name in units):
+            raise ValueError(f"utc_span needs an unwrapped unit to anchor {', '.join(units)} to a single span")
+        start = compose_unit_values(cls, units)
+        epoch = schema.epoch_timestamp
+        return start / cls.seconds_ratio + epoch, (start + length) / cls.seconds_ratio + epoch
+
+    def to_ticks(self):
+        from .ticks import RTSTicks
+
+        return RTSTicks.from_units(self)
+
+    @classmethod
+    def ticks_from_utc_timestamp(cls, timestamp: float):
+        from .ticks import RTSTicks
+
+        return RTSTicks.from_utc_timestamp(cls, timestamp)
+
+    def format(self, template: str) -> str:
+        from .formatting import format_units
+
+        return format_units(self, template)
+
+    @classmethod
+    def parse(cls, template: str, text: str) -> Self:
+        from .formatting import parse_units
+
+        return parse_units(cls, template, text)
 
     @classmethod
     def from_timestamp(cls, timestamp: float):
@@ -88,20 +357,21 @@ class RTSTimeUnits:
 
     @classmethod
     def unit_map(cls):
-        unit_map: dict[str, RTSUnit] = {}
-        vars = cls.__class__.__dict__.copy()
-        vars.update(cls.__dict__)
-        for key, value in vars.items():
-            if isinstance(value, RTSUnit):
-                unit_map[key] = value
-        return unit_map
+        schema = cls._schema
+        return dict(zip(schema.names, schema.units))
 
     @classmethod
     def construct_from_dict(cls: type[Self], data: dict[str, Any]) -> type[Self]:
         if cls is not RTSTimeUnits:
             raise AttributeError("construct_from_dict can only be called on RTSTimeUnits directly")
+        from .registry import units_registry
+
+        return units_registry.get_or_create(data, lambda: cls._build_from_dict(data))
+
+    @classmethod
+    def _build_from_dict(cls: type[Self], data: dict[str, Any]) -> type[Self]:
         class DynRTSTimeUnits(cls):
-            epoch = datetime.datetime.fromtimestamp(data["epoch"])
+            epoch = datetime.datetime.fromtimestamp(data["epoch"], datetime.UTC)
             seconds_ratio = data["seconds_ratio"]
             pass
 
@@ -109,32 +379,27 @@ class RTSTimeUnits:
         new_cls.__name__ = data["name"]
         for unit_name, unit_data in data["units"].items():
             setattr(new_cls, unit_name, RTSUnit.from_dict(unit_data))
+        new_cls._schema = _lazy_schema  # type: ignore[assignment]
         return new_cls
 
     def __getitem__(self, name: str) -> Any:
         return self.units[name]
 
     def __iter__(self):
-        return iter(self.units)
+        return iter(self._schema.names)
 
     @classmethod
     def to_dict(cls):
         return {
             "units": {key: value.to_dict() for key, value in cls.unit_map().items()},
-            "epoch": cls.epoch.timestamp(),
+            "epoch": cls._schema.epoch_timestamp,
             "seconds_ratio": cls.seconds_ratio,
             "name": cls.__name__,
         }
 
     @property
-    def units(self):
-        unit_map: dict[str, GeneratedRSTUnit] = {}
-        vars = self.__class__.__dict__.copy()
-        vars.update(self.__dict__)
-        for key, value in vars.items():
-            if isinstance(value, RTSUnit):
-                unit_map[key] = value.generate_unit(self.timestamp)
-        return unit_map
+    def units(self) -> UnitsView:
+        return UnitsView(self)
 
 
 class RTSUnit:
@@ -164,8 +429,10 @@ class RTSUnit:
             raise AttributeError("RSTUnit can only be accessed through RSTimeUnits")
         if not hasattr(obj, "timestamp"):
             obj.timestamp = 0
-        obj.timestamp += int(value * self.length)
+        obj.timestamp += value * self.length
 
     def to_dict(self):
         return {"length": self.length, "wrap": self.wrap}
 
+
+RTSTimeUnits._schema = _lazy_schema  # type: ignore[assignment]
@@ -0,0 +1,121 @@
+import datetime
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from .units import RTSTimeUnits
+
+
+class UnitArrays(NamedTuple):
+    absolute_unit: Any
+    visual_unit: Any
+
+
+class UnitBuckets(NamedTuple):
+    keys: Any
+    counts: Any
+    groups: Any
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("numpy is required for vectorized operations, install rts-datetime[numpy]") from exc
+    return numpy
+
+
+def utc_timestamps(datetimes: Iterable[datetime.datetime], assume_utc: bool = False):
+    from .units import utc_timestamp
+
+    np = _numpy()
+    if not isinstance(datetimes, (list, tuple)):
+        datetimes = list(datetimes)
+    return np.fromiter((utc_timestamp(dt, assume_utc) for dt in datetimes), dtype=np.float64, count=len(datetimes))
+
+
+def _unit_timestamps(time_units: type["RTSTimeUnits"], timestamps: Any):
+    np = _numpy()
+    schema = time_units._schema
+    if schema.seconds_ratio is None:
+        raise AttributeError(f"{time_units.__name__} must have a seconds_ratio attribute")
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if timestamps.ndim != 1:
+        raise ValueError(f"expected a 1-D array of timestamps, got {timestamps.ndim} dimensions")
+    return (timestamps - schema.epoch_timestamp) * schema.seconds_ratio
+
+
+def decompose_unit(unit_timestamps: Any, length: float, wrap: int) -> UnitArrays:
+    np = _numpy()
+    unit = np.floor_divide(unit_timestamps, length)
+    if wrap:
+        unit = np.mod(unit, wrap)
+    unit = unit.astype(np.int64)
+    absolute_unit = np.where(unit_timestamps < 0, -unit, unit)
+    visual_unit = np.where(absolute_unit < 0, (wrap - 1) + absolute_unit, absolute_unit)
+    return UnitArrays(absolute_unit, visual_unit)
+
+
+def decompose_timestamps(time_units: type["RTSTimeUnits"], unit_timestamps: Any) -> dict[str, UnitArrays]:
+    schema = time_units._schema
+    return {
+        name: decompose_unit(unit_timestamps, length, wrap)
+        for name, length, wrap in zip(schema.names, schema.lengths, schema.wraps)
+    }
+
+
+def decompose(time_units: type["RTSTimeUnits"], timestamps: Any) -> dict[str, UnitArrays]:
+    return decompose_timestamps(time_units, _unit_timestamps(time_units, timestamps))
+
+
+def compose_units(time_units: type["RTSTimeUnits"], columns: dict[str, Any]):
+    np = _numpy()
+    schema = time_units._schema
+    timestamps = None
+    for name, values in columns.items():
+        index = schema.positions.get(name)
+        if index is None:
+            raise TypeError(f"{time_units.__name__} has no unit {name}")
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(f"column '{name}' must be 1-D, got {values.ndim} dimensions")
+        if timestamps is not None and len(values) != len(timestamps):
+            raise ValueError("compose columns must all have the same length")
+        wrap = schema.wraps[index]
+        if wrap:
+            invalid = np.flatnonzero((values < 0) | (values >= wrap))
+            if len(invalid):
+                row = int(invalid[0])
+                raise ValueError(f"{name} must be in range(0, {wrap}), got {values[row]} at row {row}")
+        term = values * schema.lengths[index]
+        timestamps = term if timestamps is None else timestamps + term
+    if timestamps is None:
+        raise TypeError("compose requires at least one unit column")
+    return timestamps
+
+
+def compose(time_units: type["RTSTimeUnits"], columns: dict[str, Any]):
+    np = _numpy()
+    schema = time_units._schema
+    if schema.seconds_ratio is None:
+        raise AttributeError(f"{time_units.__name__} must have a seconds_ratio attribute")
+    unit_timestamps = compose_units(time_units, columns).astype(np.float64)
+    return unit_timestamps / schema.seconds_ratio + schema.epoch_timestamp
+
+
+def bucket_utc_timestamps(
+    time_units: type["RTSTimeUnits"], timestamps: Any, unit: str, wrapped: bool = False
+) -> UnitBuckets:
+    np = _numpy()
+    schema = time_units._schema
+    index = schema.positions.get(unit)
+    if index is None:
+        raise TypeError(f"{time_units.__name__} has no unit {unit}")
+    unit_timestamps = _unit_timestamps(time_units, timestamps)
+    length, wrap = schema.lengths[index], schema.wraps[index]
+    if wrapped and wrap:
+        labels = decompose_unit(unit_timestamps, length, wrap).visual_unit
+    else:
+        labels = np.floor_divide(unit_timestamps, length).astype(np.int64)
+    keys, groups, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    return UnitBuckets(keys, counts, groups)
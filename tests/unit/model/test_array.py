@@ -0,0 +1,71 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.transformer import TimestampTransformer
+
+np = pytest.importorskip("numpy")
+
+from rtsdatetime.array import RTSDateTimeArray  # noqa: E402
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    delayed = TimestampTransformer(start, lambda timestamp: timestamp + 60)
+    clock = TimeComponent(RSTUnits, start)
+    std = TimeComponent(StandardUnits, delayed)
+
+
+@pytest.fixture
+def events():
+    return [Event(start=1_700_000_000 + index * 97.5, end=1_700_000_000 + index * 1000) for index in range(50)]
+
+
+def test_from_objects_round_trip(events):
+    array = RTSDateTimeArray.from_objects(Event, events)
+    assert len(array) == 50
+    assert array["start"].dtype == np.float64
+    assert array[3] == events[3]
+    assert array[-1].timestamp_map == events[-1].timestamp_map
+    assert list(array) == events
+
+
+def test_slicing_and_masking(events):
+    array = RTSDateTimeArray.from_objects(Event, events)
+    assert len(array[10:20]) == 10
+    assert array[10:20][0] == events[10]
+    masked = array[array["start"] > events[24].start]
+    assert len(masked) == 25
+    assert masked[0] == events[25]
+    index = np.argmax(array["start"])
+    assert array[index] == events[-1]
+    assert array[np.int32(-2)] == events[-2]
+    with pytest.raises(IndexError):
+        array[np.int64(50)]
+
+
+def test_timestamp_map_includes_transformers(events):
+    array = RTSDateTimeArray.from_objects(Event, events)
+    timestamp_map = array.timestamp_map
+    assert list(timestamp_map) == ["start", "end", "delayed"]
+    assert timestamp_map["delayed"].tolist() == [event.delayed for event in events]
+
+
+def test_component_units(events):
+    array = RTSDateTimeArray.from_objects(Event, events)
+    for name in ("clock", "std"):
+        units = array.units(name)
+        for index, event in enumerate(events):
+            for unit_name, unit in event[name].units.items():
+                assert units[unit_name].visual_unit[index] == unit.visual_unit
+
+
+def test_integer_columns_and_validation():
+    array = RTSDateTimeArray(Event, {"start": np.arange(5)})
+    assert array["start"].dtype == np.int64
+    assert array["end"].tolist() == [0.0] * 5
+    with pytest.raises(ValueError):
+        RTSDateTimeArray(Event, {"delayed": np.arange(5)})
+    with pytest.raises(ValueError):
+        RTSDateTimeArray(Event, {"start": np.arange(5), "end": np.arange(4)})
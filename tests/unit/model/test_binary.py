@@ -0,0 +1,93 @@
+import pytest
+
+from rtsdatetime.binary import RTSBinaryReader, write_records
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+    std = TimeComponent(RSTStandardUnits, end)
+
+
+@pytest.fixture
+def events():
+    return [Event(start=1_700_000_000 + index * 7.25, end=1_700_000_000 + index * 60.0) for index in range(1000)]
+
+
+def test_round_trip(tmp_path, events):
+    path = tmp_path / "events.rtsb"
+    assert write_records(path, Event, events, chunk_size=64) == 1000
+    with RTSBinaryReader(path) as reader:
+        assert len(reader) == 1000
+        assert reader.fields == ("start", "end")
+        assert reader.datetime_cls.dump_json() == Event.dump_json()
+        view = reader[500]
+        assert view["start"] == events[500].start
+        assert view.timestamp_map == events[500].timestamp_map
+        assert str(view.units("clock")) == str(events[500].clock)
+        assert reader[-1].materialize().rst_timestamp() == events[-1].rst_timestamp()
+        assert list(reader.column("end"))[:3] == [event.end for event in events[:3]]
+        assert [record.values() for record in reader] == [(event.start, event.end) for event in events]
+        with pytest.raises(IndexError):
+            reader[1000]
+
+
+def test_integer_records(tmp_path):
+    path = tmp_path / "events.rtsb"
+    write_records(path, Event, [Event(start=index, end=-index) for index in range(10)], dtype="q")
+    with RTSBinaryReader(path) as reader:
+        assert reader.dtype == "q"
+        assert reader[9].values() == (9, -9)
+
+
+def test_array_round_trip(tmp_path, events):
+    np = pytest.importorskip("numpy")
+    from rtsdatetime.array import RTSDateTimeArray
+
+    path = tmp_path / "events.rtsb"
+    write_records(path, Event, RTSDateTimeArray.from_objects(Event, events))
+    reader = RTSBinaryReader(path)
+    matrix = reader.to_numpy()
+    assert matrix.shape == (1000, 2)
+    assert np.array_equal(reader.to_array()["end"], np.array([event.end for event in events]))
+    assert reader[10].values() == (events[10].start, events[10].end)
+    reader.close()
+    assert matrix[10, 1] == events[10].end
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "events.rtsb"
+    path.write_bytes(b"not an rts binary file at all")
+    with pytest.raises(ValueError):
+        RTSBinaryReader(path)
+    for content in (b"RTSB", b"", b"RTSB\x01\x00d\x00\x02\x00\x00\x00\xff\x00\x00\x00"):
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            RTSBinaryReader(path)
+
+
+def test_rejects_partial_records(tmp_path, events):
+    path = tmp_path / "events.rtsb"
+    write_records(path, Event, events[:3])
+    with open(path, "ab") as file:
+        file.write(b"\x00\x00\x00")
+    with pytest.raises(ValueError, match="partway"):
+        RTSBinaryReader(path)
+
+
+class Tagged(RTSDateTime):
+    start = Timestamp()
+    recorded = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+def test_keeps_fields_without_components(tmp_path):
+    path = tmp_path / "tagged.rtsb"
+    write_records(path, Tagged, [Tagged(start=1, recorded=2)])
+    with RTSBinaryReader(path) as reader:
+        assert reader.datetime_cls._schema.settable == ("start", "recorded")
+        record = reader[0].materialize()
+        assert (record.start, record.recorded) == (1, 2)
@@ -0,0 +1,68 @@
+import json
+
+from rtsdatetime.cli import main
+from rtsdatetime.default_units import RSTUnits
+
+
+def _run(tmp_path, capsys, content, *args):
+    source = tmp_path / "input"
+    source.write_text(content)
+    assert main(["convert", str(source), "--quiet", *args]) == 0
+    return capsys.readouterr().out.splitlines()
+
+
+def test_csv_with_template(tmp_path, capsys):
+    content = "ts,x\n1700000000,a\n\n2020-01-01T00:00:00,b\n"
+    out = _run(tmp_path, capsys, content, "--column", "ts", "--template", "[units.day]")
+    day = RSTUnits.from_utc_timestamp(1700000000).day.visual_unit
+    assert out[0] == f"timestamp=1700000000.0,{day}"
+    assert out[1].startswith("timestamp=")
+    assert len(out) == 2
+
+
+def test_ndjson_workers_preserve_order(tmp_path, capsys):
+    content = "".join(json.dumps({"t": 1_600_000_000 + i}) + "\n" for i in range(50))
+    args = ["--input-format", "ndjson", "--column", "t", "--output-format", "ndjson", "--workers", "2", "--chunk-size", "7"]
+    out = _run(tmp_path, capsys, content, *args)
+    assert [json.loads(line)["rst_timestamp"] for line in out] == [
+        f"timestamp={1_600_000_000 + i}.0" for i in range(50)
+    ]
+
+
+def test_schema_file_and_errors(tmp_path, capsys):
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"clock": {"units": RSTUnits.to_dict(), "timestamp": "start"}}))
+    source = tmp_path / "input.csv"
+    source.write_text("1\nnope\n")
+    assert main(["convert", str(source), "--schema", str(schema)]) == 1
+    assert "line 2" in capsys.readouterr().err
+    assert main(["convert", str(source), "--schema", str(schema), "--skip-invalid", "--quiet"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "start=1.0\n"
+    assert "skipped line 2" in captured.err
+
+
+def test_naive_iso_is_utc_and_quoted_newlines(tmp_path, capsys):
+    content = 'note,ts\n"two\nlines",2020-01-01T00:00:00\nplain,2020-01-01T00:00:00+00:00\n'
+    out = _run(tmp_path, capsys, content, "--column", "ts")
+    assert out == [f"timestamp={1577836800.0}"] * 2
+
+
+def test_column_per_timestamp(tmp_path, capsys):
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        json.dumps(
+            {
+                "first": {"units": RSTUnits.to_dict(), "timestamp": "start"},
+                "second": {"units": RSTUnits.to_dict(), "timestamp": "end"},
+            }
+        )
+    )
+    source = tmp_path / "input.csv"
+    source.write_text("a,b\n1,2\n")
+    assert main(["convert", str(source), "--schema", str(schema), "--column", "a"]) == 1
+    assert "FIELD=COLUMN" in capsys.readouterr().err
+    out = _run(tmp_path, capsys, "a,b\n1,2\n", "--schema", str(schema), "--column", "start=b", "--column", "end=a")
+    assert out == ['"start=2.0,end=1.0"']
+    out = _run(tmp_path, capsys, "end,start\n1,2\n", "--schema", str(schema))
+    assert out == ['"start=2.0,end=1.0"']
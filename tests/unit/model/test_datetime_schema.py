@@ -0,0 +1,32 @@
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.transformer import TimestampTransformer
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    shifted = TimestampTransformer(start, lambda timestamp: timestamp + 60)
+    clock = TimeComponent(RSTUnits, start)
+    std = TimeComponent(RSTStandardUnits, end)
+
+
+def test_schema_fields():
+    schema = Event._schema
+    assert schema.timestamps == ("start", "end", "shifted")
+    assert schema.settable == ("start", "end")
+    assert schema.components == ("clock", "std")
+
+
+def test_timestamp_map():
+    event = Event(start=10, end=20)
+    assert event.timestamp_map == {"start": 10, "end": 20, "shifted": 70}
+    assert event.rst_timestamp() == "start=10,end=20,shifted=70"
+    assert set(event.units_map) == {"clock", "std"}
+
+
+def test_load_json_compiles_schema():
+    dyn_cls = RTSDateTime.load_json(Event.dump_json())
+    assert dyn_cls._schema.components == ("clock", "std")
+    assert dyn_cls._schema.settable == ("start", "end")
+    assert str(dyn_cls(start=10, end=20)) == str(Event(start=10, end=20)).replace("Event", dyn_cls.__name__)
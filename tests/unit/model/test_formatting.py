@@ -0,0 +1,100 @@
+import pytest
+
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits, StandardUnits
+from rtsdatetime.formatting import compile_template
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+
+RTS_TEMPLATE = "[clock.DA] [clock.OC]:[clock.HE]:[clock.TA].[clock.DE][clock.BE:02]"
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+    std = TimeComponent(RSTStandardUnits, start)
+    end_clock = TimeComponent(RSTUnits, end)
+
+
+def test_units_format():
+    units = RSTUnits(day=12, octa=3, hexa=7, tap=5, decitap=9, beat=4)
+    assert units.format("[DA] [OC]:[HE]:[TA].[DE][BE:02]") == "12 3:7:5.904"
+    assert units.format("[rolling_octa] [octa:>3]") == "75   3"
+
+
+def test_datetime_format():
+    event = Event(start=1_700_000_000.5)
+    clock = event.clock.units.visual_units()
+    expected = f"{clock['day']} {clock['octa']}:{clock['hexa']}:{clock['tap']}.{clock['decitap']}{clock['beat']:02}"
+    assert event.format(RTS_TEMPLATE) == expected
+    assert event.format("[std.HO:02]:[std.MI:02] [std.RH]") == (
+        f"{event.std['hour'].visual_unit:02}:{event.std['minute'].visual_unit:02} {event.std['rolling_hour'].visual_unit}"
+    )
+
+
+def test_templates_are_cached():
+    assert compile_template(Event, RTS_TEMPLATE) is compile_template(Event, RTS_TEMPLATE)
+    program = compile_template(Event, "[clock.BE] [std.SE]")
+    assert program.components == ("clock", "std")
+    assert [field.unit for field in program.fields] == ["beat", "seconds"]
+    assert program.component_fields == (Event.__dict__["clock"], Event.__dict__["std"])
+
+
+def test_cached_template_formats_without_component_lookup(monkeypatch):
+    event = Event(start=1_700_000_000.5)
+    expected = event.format(RTS_TEMPLATE)
+    monkeypatch.setattr(Event, "_component_map", classmethod(lambda cls: pytest.fail("component map rebuilt")))
+    assert event.format(RTS_TEMPLATE) == expected
+
+
+@pytest.mark.parametrize("template", ["[nope.BE]", "[clock.XX]", "[BE]", "[clock.BE:q]"])
+def test_invalid_templates(template):
+    with pytest.raises(ValueError):
+        Event(start=0).format(template)
+
+
+def test_parse_round_trip():
+    units = RSTUnits(day=12, octa=3, hexa=7, tap=5, decitap=9, beat=4)
+    assert RSTUnits.parse("[DA] [OC]:[HE]:[TA].[DE][BE:02]", "12 3:7:5.904").timestamp == units.timestamp
+    event = Event(start=1_700_000_000.5, end=1_600_000_000)
+    template = RTS_TEMPLATE + " / [end_clock.DA] [end_clock.OC]:[end_clock.HE]"
+    parsed = Event.parse(template, event.format(template))
+    assert parsed.format(template) == event.format(template)
+
+
+def test_parse_rejects_shared_timestamps():
+    with pytest.raises(ValueError):
+        Event.parse("[clock.BE] [std.SE]", "1 2")
+    with pytest.raises(ValueError):
+        RSTUnits.parse("[BE]:[beat]", "1:2")
+
+
+@pytest.mark.parametrize("units", [RSTUnits, RSTStandardUnits, StandardUnits])
+def test_full_template_round_trip(units):
+    template = " ".join(f"[{name}]" for name in units._schema.names)
+    for timestamp in (0, 1, 84500645, 168596645, 987654321, 3 * 168310080 + 7):
+        text = units.from_timestamp(timestamp).format(template)
+        assert units.parse(template, text).timestamp == timestamp
+
+
+def test_parse_overlapping_unwrapped_units():
+    assert RSTUnits.parse("[YE] [DA] [BE]", "2 733 5").timestamp == 733 * 115200 + 5
+    with pytest.raises(ValueError):
+        RSTUnits.parse("[YE] [DA]", "2 10")
+
+
+def test_template_cache_does_not_keep_classes_alive():
+    import gc
+    import weakref
+
+    from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+    class Temporary(RTSTimeUnits):
+        tick: RTSUnit = RTSUnit(1, 0)
+        seconds_ratio = 1
+
+    Temporary.from_timestamp(3).format("[tick]")
+    Temporary.parse("[tick]", "3")
+    reference = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert reference() is None
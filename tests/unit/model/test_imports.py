@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import rtsdatetime
+
+
+def test_import_is_lazy():
+    check = (
+        "import sys, rtsdatetime; "
+        "print(sorted(m for m in ('base64', 'secrets', 'dataclasses', 'tempfile', "
+        "'rtsdatetime.default_units', 'rtsdatetime.transformer', 'rtsdatetime.array') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", check], check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes():
+    from rtsdatetime.array import RTSDateTimeArray
+    from rtsdatetime.default_units import RSTUnits
+
+    assert rtsdatetime.RTSDateTimeArray is RTSDateTimeArray
+    assert rtsdatetime.default_units.RSTUnits is RSTUnits
+    assert "transformer" in dir(rtsdatetime)
+
+
+def test_schema_compiles_on_first_access():
+    from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+    class Lazy(RTSTimeUnits):
+        tick: RTSUnit = RTSUnit(1, 10)
+        seconds_ratio = 1
+
+    assert "_schema" in Lazy.__dict__ and not isinstance(Lazy.__dict__["_schema"], tuple)
+    assert Lazy(tick=3).units.visual_unit("tick") == 3
+    assert Lazy.__dict__["_schema"].names == ("tick",)
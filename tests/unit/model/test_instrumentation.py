@@ -0,0 +1,90 @@
+from rtsdatetime import cache, instrumentation
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.transformer import TimestampTransformer
+from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    assert Timestamp.__dict__["__get__"].__module__ == "rtsdatetime.model"
+    assert RTSUnit.__dict__["__get__"].__module__ == "rtsdatetime.units"
+
+
+def test_profile_counts_calls():
+    event = Event(start=1_700_000_000)
+    with instrumentation.profile() as profile:
+        for _ in range(10):
+            _ = event.clock
+        _ = RSTUnits.from_timestamp(5).beat
+    assert not instrumentation.is_enabled()
+    assert profile.counters[("TimeComponent.__get__", "Event")].calls == 10
+    assert profile.counters[("Timestamp.__get__", "Event")].calls == 10
+    assert profile.counters[("RTSTimeUnits.from_utc_timestamp", "RSTUnits")].calls == 10
+    assert profile.calls("RTSUnit.__get__") == 1
+    assert profile.counters[("TimeComponent.__get__", "Event")].total_time > 0
+    assert RTSTimeUnits.__dict__["from_utc_timestamp"].__func__.__module__ == "rtsdatetime.units"
+
+
+def test_enable_and_export():
+    exported = []
+    instrumentation.reset()
+    instrumentation.add_exporter(exported.append)
+    instrumentation.enable()
+    try:
+        _ = Event(start=1).start
+        with instrumentation.profile():
+            pass
+        assert instrumentation.is_enabled()
+    finally:
+        instrumentation.disable()
+        instrumentation.export()
+        instrumentation.remove_exporter(exported.append)
+    assert exported[0][("Timestamp.__get__", "Event")].calls == 1
+
+
+class Shifted(RTSDateTime):
+    start = Timestamp()
+    shifted = TimestampTransformer(start, affine=(1, 60))
+
+
+def test_profile_counts_overriding_subclasses():
+    record = Shifted(start=1)
+    with instrumentation.profile() as profile:
+        _ = record.shifted
+    assert profile.counters[("TimestampTransformer.__get__", "Shifted")].calls == 1
+    assert profile.counters[("Timestamp.__get__", "Shifted")].calls == 1
+    assert TimestampTransformer.__dict__["__get__"].__module__ == "rtsdatetime.transformer"
+
+
+def test_overlapping_profiles_keep_instrumentation_until_last_exit():
+    first = instrumentation.profile()
+    second = instrumentation.profile()
+    first.__enter__()
+    second_profile = second.__enter__()
+    first.__exit__(None, None, None)
+    assert instrumentation.is_enabled()
+    _ = Event(start=1).start
+    second.__exit__(None, None, None)
+    assert not instrumentation.is_enabled()
+    assert Timestamp.__dict__["__get__"].__module__ == "rtsdatetime.model"
+    assert second_profile.counters[("Timestamp.__get__", "Event")].calls == 1
+
+
+def test_cache_installed_while_profiling_stops_counting():
+    with instrumentation.profile():
+        cache.enable_cache(RSTUnits)
+    try:
+        with instrumentation.profile() as profile:
+            pass
+        instrumentation.reset()
+        RSTUnits.from_utc_timestamp(1_700_000_000)
+        assert instrumentation.snapshot() == {}
+    finally:
+        cache.disable_cache(RSTUnits)
+    assert profile.counters == {}
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.ndjson import RTSNDJSONWriter, iter_ndjson, write_ndjson
+from rtsdatetime.parser import RTSTimestampParseError
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+    finish = TimeComponent(StandardUnits, end)
+
+
+def test_roundtrip_resolves_schema_once(tmp_path):
+    events = [Event(start=1_700_000_000 + i, end=1_700_000_500.5 + i) for i in range(10)]
+    path = tmp_path / "events.ndjson"
+    write_ndjson(path, Event, events)
+    lines = path.read_text().splitlines()
+    assert len(lines) == 11
+    assert lines[1] == "[1700000000,1700000500.5]"
+    loaded = list(iter_ndjson(path))
+    assert len({type(obj) for obj in loaded}) == 1
+    assert [obj.timestamp_map for obj in loaded] == [event.timestamp_map for event in events]
+    assert loaded[3].clock.units.visual_units() == events[3].clock.units.visual_units()
+    assert [obj.start for obj in iter_ndjson(path, Event)] == [event.start for event in events]
+
+
+def test_writer_buffers():
+    stream = io.StringIO()
+    writer = RTSNDJSONWriter(stream, Event, buffer_size=3)
+    writer.write(Event(start=1, end=2))
+    assert stream.getvalue() == ""
+    writer.write(Event(start=3, end=4))
+    assert len(stream.getvalue().splitlines()) == 3
+    with pytest.raises(TypeError):
+        writer.write(object())
+    writer.write(Event(start=5, end=6))
+    writer.close()
+    writer.close()
+    assert writer.closed
+    assert len(stream.getvalue().splitlines()) == 4
+    with pytest.raises(ValueError, match="closed writer"):
+        writer.write(Event(start=7, end=8))
+
+
+def test_errors():
+    stream = io.StringIO()
+    write_ndjson(stream, Event, [Event(start=1, end=2)])
+    header, record = stream.getvalue().splitlines()
+    errors = []
+    loaded = list(iter_ndjson([header, "[1]", "nope", "", record], on_error=errors.append))
+    assert [obj.start for obj in loaded] == [1]
+    assert [error.lineno for error in errors] == [2, 3]
+    with pytest.warns(RuntimeWarning, match="line 2"):
+        assert len(list(iter_ndjson([header, "[1]", record]))) == 1
+    with pytest.raises(RTSTimestampParseError):
+        list(iter_ndjson(["{}"]))
+    assert list(iter_ndjson([])) == []
@@ -0,0 +1,54 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.parser import RTSTimestampParseError
+from rtsdatetime.transformer import TimestampTransformer
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    end = Timestamp()
+    delayed = TimestampTransformer(start, lambda timestamp: timestamp + 60)
+    clock = TimeComponent(RSTUnits, start)
+
+
+def test_round_trips_rst_timestamp():
+    events = [Event(start=index * 1.5, end=index * 2.5) for index in range(10)]
+    lines = [event.rst_timestamp() + "\n" for event in events]
+    assert list(Event.iter_from_rts_timestamps(lines)) == events
+
+
+def test_generic_layout():
+    (event,) = Event.iter_from_rts_timestamps(["end=4,start=3"])
+    assert event.timestamp_map == {"start": 3.0, "end": 4.0, "delayed": 63.0}
+    (event,) = Event.iter_from_rts_timestamps(["end=4"])
+    assert event.start == 0
+
+
+def test_reports_malformed_lines():
+    errors: list[RTSTimestampParseError] = []
+    lines = ["start=1,end=2", "start=x,end=2", "", "start=1=2", "bogus=3", "start=5,end=6"]
+    events = list(Event.iter_from_rts_timestamps(lines, on_error=errors.append))
+    assert [event.start for event in events] == [1.0, 5.0]
+    assert [error.lineno for error in errors] == [2, 4, 5]
+
+
+def test_default_error_report_warns():
+    with pytest.warns(RuntimeWarning, match="line 1"):
+        assert list(Event.iter_from_rts_timestamps(["start=oops"])) == []
+
+
+def test_columns(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "events.rts"
+    path.write_text("".join(f"start={index},end={index * 2}\n" for index in range(25)))
+    chunks = list(Event.iter_from_rts_timestamps(path, columns=True, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[2]["end"].tolist() == [40.0, 42.0, 44.0, 46.0, 48.0]
+
+
+def test_string_source_is_a_path(tmp_path):
+    path = tmp_path / "events.rts"
+    path.write_text("start=1,end=2\nstart=3,end=4\n")
+    assert [event.end for event in Event.iter_from_rts_timestamps(str(path))] == [2, 4]
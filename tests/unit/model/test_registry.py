@@ -0,0 +1,57 @@
+import gc
+import json
+import threading
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.registry import SchemaRegistry, schema_hash
+from rtsdatetime.units import RTSTimeUnits
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+    std = TimeComponent(StandardUnits, start)
+
+
+def test_schema_hash_is_canonical():
+    assert schema_hash({"a": 1, "b": [1, 2]}) == schema_hash({"b": [1, 2], "a": 1})
+    assert schema_hash({"a": 1}) != schema_hash({"a": 2})
+
+
+def test_identical_schemas_share_classes():
+    schema = Event.dump_json()
+    reordered = json.dumps(json.loads(schema), indent=2, sort_keys=True)
+    assert RTSDateTime.load_json(schema) is RTSDateTime.load_json(reordered)
+    assert RTSTimeUnits.construct_from_dict(RSTUnits.to_dict()) is RTSTimeUnits.construct_from_dict(RSTUnits.to_dict())
+    assert RTSTimeUnits.construct_from_dict(RSTUnits.to_dict()) is not RTSTimeUnits.construct_from_dict(
+        StandardUnits.to_dict()
+    )
+
+
+def test_stats_and_eviction():
+    registry: SchemaRegistry[type] = SchemaRegistry(maxsize=2)
+    created = [registry.get_or_create({"id": index}, lambda index=index: type(f"C{index}", (), {})) for index in range(3)]
+    assert registry.get_or_create({"id": 2}, lambda: type("Other", (), {})) is created[2]
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+    del created
+    gc.collect()
+    assert registry.stats().size == 2
+
+
+def test_thread_safe_creation():
+    registry: SchemaRegistry[type] = SchemaRegistry()
+    results: list[type] = []
+
+    def worker():
+        for _ in range(100):
+            results.append(registry.get_or_create({"shared": True}, lambda: type("Shared", (), {})))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(cls) for cls in results}) == 1
+    assert registry.stats().misses == 1
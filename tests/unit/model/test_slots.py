@@ -0,0 +1,72 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, RTSTimeDelta, TimeComponent, Timestamp
+from rtsdatetime.units import GeneratedRSTUnit, RTSTimeUnits, RTSUnit
+
+
+class Event(RTSDateTime, slots=True):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+class ExtendedEvent(Event, slots=True):
+    end = Timestamp()
+
+
+class SlottedUnits(RTSTimeUnits, slots=True):
+    beat: RTSUnit = RTSUnit(1, 40)
+    seconds_ratio = 1
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        GeneratedRSTUnit(1, 40, 10),
+        RTSTimeDelta(5, RSTUnits),
+        SlottedUnits(beat=3),
+        Event(start=1),
+        ExtendedEvent(start=1, end=2),
+    ],
+)
+def test_opted_in_instances_have_no_dict(instance):
+    assert not hasattr(instance, "__dict__")
+
+
+def test_slots_generated_per_timestamp():
+    assert Event.__slots__ == ("_start",)
+    assert ExtendedEvent.__slots__ == ("_end",)
+    event = ExtendedEvent(end=2)
+    assert event.timestamp_map == {"start": 0, "end": 2}
+    with pytest.raises(AttributeError):
+        event.unknown = 1
+
+
+class Started(RTSDateTime):
+    start = Timestamp()
+
+
+class Ended(RTSDateTime):
+    end = Timestamp()
+
+
+class Span(Started, Ended):
+    clock = TimeComponent(RSTUnits, Started.__dict__["start"])
+
+
+def test_slots_are_opt_in():
+    for instance in (Started(start=1), RSTUnits(beat=3), RTSDateTime.load_json(Event.dump_json())(start=1)):
+        instance.note = "kept"
+        assert instance.note == "kept"
+
+
+def test_mixin_of_unslotted_classes():
+    span = Span(start=1, end=2)
+    assert Span._schema.settable == ("end", "start")
+    assert (span.start, span.end) == (1, 2)
+    assert span.clock.timestamp == RSTUnits.from_utc_timestamp(1).timestamp
+
+
+def test_units_default_timestamp():
+    assert RSTUnits().timestamp == 0
+    assert RSTUnits(beat=3, day=1).timestamp == 115203
@@ -0,0 +1,81 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.timeline import RTSTimeline
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+def _event(**units):
+    return Event(start=RSTUnits.utc_span(**units)[0] + 1)
+
+
+def test_utc_span():
+    start, stop = RSTUnits.utc_span(day=7012, octa=3)
+    assert RSTUnits.from_utc_timestamp(start + 1).day.visual_unit == 7012
+    assert RSTUnits.from_utc_timestamp(start + 1).octa.visual_unit == 3
+    assert (stop - start) * RSTUnits.seconds_ratio == pytest.approx(19200)
+    with pytest.raises(ValueError):
+        RSTUnits.utc_span(octa=6)
+    with pytest.raises(TypeError):
+        RSTUnits.utc_span(week=1)
+    with pytest.raises(ValueError, match="unwrapped"):
+        RSTUnits.utc_span(octa=3)
+
+
+def test_utc_span_overlapping_units():
+    start, stop = RSTUnits.utc_span(year=19, day=7012)
+    assert RSTUnits.from_utc_timestamp(start + 1).day.visual_unit == 7012
+    assert (stop - start) * RSTUnits.seconds_ratio == pytest.approx(115200)
+    with pytest.raises(ValueError):
+        RSTUnits.utc_span(year=3, day=7012)
+
+
+def test_unit_queries():
+    events = [_event(day=7012, octa=3), _event(day=7011), _event(day=7012, octa=3, hexa=2), _event(day=7012)]
+    timeline = RTSTimeline.from_objects(Event, "start", events)
+    assert timeline.time_units is RSTUnits
+    assert len(timeline) == 4
+    assert sorted(timeline.select(day=7012, octa=3)) == [0, 2]
+    assert timeline.count(day=7012) == 3
+    assert timeline.count(day=7013) == 0
+    with pytest.raises(ValueError):
+        timeline.count(octa=3)
+    assert next(iter(timeline)) == 1
+    assert list(timeline.timestamps) == sorted(event.start for event in events)
+
+
+def test_insert_and_merge():
+    first = RTSTimeline.from_objects(Event, "start", [_event(day=1), _event(day=3)])
+    second = RTSTimeline(Event, "start")
+    assert second.insert(_event(day=2), id=10) == 10
+    assert second.insert(_event(day=0)) == 11
+    merged = first.merge(second)
+    assert list(merged) == [11, 0, 10, 1]
+    assert merged.count(day=2) == 1
+    assert merged.insert(_event(day=4)) == 12
+    with pytest.raises(ValueError):
+        merged.insert(_event(day=5), id=10)
+    assert merged.insert(_event(day=5), id=20) == 20
+    assert len(merged) == 6
+    with pytest.raises(ValueError):
+        first.merge(first)
+    renumbered = first.merge(first, renumber=True)
+    assert list(renumbered) == [0, 2, 1, 3]
+    assert renumbered.insert(_event(day=5)) == 4
+    with pytest.raises(ValueError):
+        first.merge(RTSTimeline(Event, "start", time_units=StandardUnits))
+
+
+def test_from_array():
+    np = pytest.importorskip("numpy")
+    from rtsdatetime.array import RTSDateTimeArray
+
+    starts = np.array([RSTUnits.utc_span(day=5)[0] + 1, RSTUnits.utc_span(day=4)[0] + 1])
+    timeline = RTSTimeline.from_array(RTSDateTimeArray(Event, {"start": starts}), "start")
+    assert list(timeline) == [1, 0]
+    assert list(timeline.select(day=5)) == [0]
@@ -0,0 +1,31 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+from rtsdatetime.transformer import TimestampTransformer
+
+
+class LoggedTimestamp(Timestamp):
+    pass
+
+
+class Record(RTSDateTime, slots=True):
+    start = LoggedTimestamp()
+    stop = Timestamp()
+    shifted = TimestampTransformer(start, affine=(1, 10))
+    clock = TimeComponent(RSTUnits, start)
+
+
+def test_timestamp_subclass_fields_are_slotted_and_settable():
+    assert Record._schema.settable == ("start", "stop")
+    assert "_start" in Record.__slots__
+    record = Record(start=5, stop=6)
+    assert (record.start, record.stop, record.shifted) == (5, 6, 15)
+    assert not hasattr(record, "__dict__")
+
+
+def test_timestamp_get_validates_stored_value():
+    record = Record(start=5)
+    Record._start.__set__(record, "5")
+    with pytest.raises(ValueError):
+        _ = record.start
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+from rtsdatetime.default_units import StandardUnits
+from rtsdatetime.model import RTSDateTime, Timestamp
+from rtsdatetime.transformer import SUTimestampTransformer, TimestampTransformer
+
+calls: list[float] = []
+
+
+def counting_transformer(timestamp: float) -> float:
+    calls.append(timestamp)
+    return timestamp * 2
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    doubled = TimestampTransformer(start, counting_transformer)
+    shifted = TimestampTransformer(start, affine=(1, 60))
+    scaled = TimestampTransformer(shifted, affine=(4 / 3, -10))
+    chained = TimestampTransformer(doubled, lambda timestamp: timestamp + 1)
+    su = SUTimestampTransformer(start)
+
+
+def test_transformed_values():
+    event = Event(start=30)
+    assert event.doubled == 60
+    assert event.shifted == 90
+    assert event.scaled == 90 * 4 / 3 - 10
+    assert event.chained == 61
+
+
+def test_affine_chains_fold():
+    chain = Event.__dict__["scaled"].compile()
+    assert chain.root is Event.__dict__["start"]
+    assert chain.affine == pytest.approx((4 / 3, 60 * 4 / 3 - 10))
+
+
+def test_results_are_memoized_until_base_changes():
+    calls.clear()
+    event = Event(start=30)
+    assert [event.doubled, event.doubled] == [60, 60]
+    assert calls == [30]
+    assert [event.chained, event.chained] == [61, 61]
+    assert calls == [30, 30]
+    event.start = 40
+    assert [event.doubled, event.doubled] == [80, 80]
+    assert calls == [30, 30, 40]
+
+
+def test_affine_reads_do_not_allocate_a_cache():
+    event = Event(start=30)
+    assert [event.shifted, event.scaled] == [90, 90 * 4 / 3 - 10]
+    assert not hasattr(event, "_transform_cache")
+    _ = event.doubled
+    assert list(event._transform_cache) == [Event.__dict__["doubled"]]
+
+
+def test_su_transformer_matches_standard_units():
+    timestamp = 1_700_000_000
+    dt = datetime.datetime.fromtimestamp(timestamp)
+    expected = StandardUnits(year=dt.year, day=dt.day, hour=dt.hour, minute=dt.minute, second=dt.second).timestamp
+    assert Event(start=timestamp).su == expected
+
+
+def test_transform_batch():
+    np = pytest.importorskip("numpy")
+    timestamps = np.array([0.0, 30.0, 45.5])
+    assert Event.__dict__["scaled"].transform_batch(timestamps).tolist() == pytest.approx(
+        [Event(start=value).scaled for value in timestamps.tolist()]
+    )
+    assert Event.__dict__["chained"].transform_batch(timestamps).tolist() == [1.0, 61.0, 92.0]
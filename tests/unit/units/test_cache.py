@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from rtsdatetime.cache import UnitCache, disable_cache, enable_cache, get_cache
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+@pytest.fixture
+def cache():
+    cache = enable_cache(RSTUnits, maxsize=4)
+    yield cache
+    disable_cache(RSTUnits)
+
+
+def test_cached_components_match_uncached(cache):
+    timestamps = [1_700_000_000 + offset * 0.1 for offset in range(30)]
+    cached = [(str(Event(start=t).clock), Event(start=t).clock.format("[day] [beat]")) for t in timestamps]
+    stats = cache.stats()
+    assert stats.hits > stats.misses
+    assert stats.size <= 4
+    disable_cache(RSTUnits)
+    assert get_cache(RSTUnits) is None
+    uncached = [(str(Event(start=t).clock), Event(start=t).clock.format("[day] [beat]")) for t in timestamps]
+    assert cached == uncached
+    enable_cache(RSTUnits)
+
+
+def test_eviction_and_ttl():
+    now = [0.0]
+    cache = UnitCache(StandardUnits, maxsize=2, ttl=10, resolution="minute", clock=lambda: now[0])
+    assert cache.entry(5).visuals["minute"] == 0
+    cache.entry(61)
+    cache.entry(59)
+    cache.entry(125)
+    assert cache.stats() == (1, 3, 1, 2)
+    now[0] = 11
+    cache.entry(125)
+    assert cache.stats().misses == 4
+    assert cache.stats().hit_rate == pytest.approx(0.2)
+    with pytest.raises(TypeError):
+        UnitCache(StandardUnits, resolution="week")
+
+
+def test_coarse_resolution_never_corrupts_finer_units():
+    cache = enable_cache(StandardUnits, resolution="minute")
+    try:
+        assert cache.cached_units == {"minute", "hour", "day", "year"}
+        units = StandardUnits.from_utc_timestamp(125)
+        assert units.units.visual_unit("second") == units["second"].visual_unit == 5
+        assert units.units.visual_unit("minute") == 2
+        assert StandardUnits.from_utc_timestamp(126).format("[MI]:[SE]") == "2:6"
+        assert StandardUnits.from_utc_timestamp(127).format("[MI]:[SE]") == "2:7"
+        assert StandardUnits.from_utc_timestamp(127).format("[HO]:[MI]") == "0:2"
+        assert str(StandardUnits.from_utc_timestamp(128)).endswith("second=8)")
+    finally:
+        disable_cache(StandardUnits)
+
+
+def test_enable_twice_and_threads(cache):
+    with pytest.raises(RuntimeError):
+        enable_cache(RSTUnits)
+
+    def render():
+        for offset in range(200):
+            str(RSTUnits.from_utc_timestamp(1_700_000_000 + offset % 8))
+
+    threads = [threading.Thread(target=render) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats.hits + stats.misses >= 800
+    assert stats.size <= 4
+
+
+def test_disable_restores_original_attributes():
+    originals = {name: RSTUnits.__dict__.get(name) for name in ("from_utc_timestamp", "format", "__str__")}
+    enable_cache(RSTUnits)
+    assert all(RSTUnits.__dict__.get(name) is not original for name, original in originals.items())
+    disable_cache(RSTUnits)
+    assert {name: RSTUnits.__dict__.get(name) for name in originals} == originals
+    disable_cache(RSTUnits)
@@ -0,0 +1,30 @@
+import random
+
+from rtsdatetime.clock import RTSClock
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+
+
+def test_incremental_matches_full_decomposition():
+    rng = random.Random(3)
+    clock = RTSClock(RSTUnits, timestamp=RSTUnits._schema.epoch_timestamp + 10)
+    for _ in range(2000):
+        previous = clock.units
+        step = rng.choice([0.01, 0.3, 0.75, 31, 1e4, 1e8, -50, -1e7])
+        changed = clock.advance(step)
+        expected = RSTUnits.from_timestamp(clock.timestamp).units.visual_units()
+        assert clock.units == expected
+        assert set(changed) == {name for name in expected if expected[name] != previous[name]}
+
+
+def test_tick_reports_changed_units():
+    now = [60.0 * 59 + 59.5]
+    clock = RTSClock(StandardUnits, clock=lambda: now[0])
+    assert clock["minute"] == 59
+    now[0] += 0.25
+    assert clock.tick() == ()
+    now[0] += 0.5
+    assert clock.tick() == ("hour", "minute", "second")
+    assert (clock["hour"], clock["minute"], clock["second"]) == (1, 0, 0)
+    assert clock.now().timestamp == clock.timestamp
+    now[0] += 1
+    assert clock.tick() == ("second",)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from rtsdatetime import codegen
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits, StandardUnits
+from rtsdatetime.units import RTSTimeUnits, RTSUnit, visual_unit_value
+
+
+class OddUnits(RTSTimeUnits):
+    half: RTSUnit = RTSUnit(0.5, 3)
+    seven: RTSUnit = RTSUnit(7, 0)
+    fourteen: RTSUnit = RTSUnit(14, 5)
+    seconds_ratio = 1
+
+
+@pytest.mark.parametrize("time_units", [RSTUnits, RSTStandardUnits, StandardUnits, OddUnits])
+def test_matches_generic_decomposition(time_units):
+    schema = time_units._schema
+    decompose = codegen.decomposer(time_units)
+    decompose_into = codegen.decomposer_into(time_units)
+    buffer = [0] * len(schema.names)
+    rng = random.Random(7)
+    for timestamp in [0, -1, 1, -0.25, 39.5, -40] + [rng.uniform(-1e9, 1e9) for _ in range(500)]:
+        expected = tuple(
+            visual_unit_value(timestamp, length, wrap) for length, wrap in zip(schema.lengths, schema.wraps)
+        )
+        assert decompose(timestamp) == expected
+        assert tuple(decompose_into(timestamp, buffer)) == expected
+
+
+def test_str_uses_generated_functions():
+    assert str(RSTUnits(day=2, hexa=3, beat=4)) == (
+        "RSTUnits(beat=4, decitap=0, tap=0, hexa=3, octa=0, rolling_octa=12, day=2, year=0, quadrennial=0)"
+    )
+
+
+def test_functions_are_generated_once_per_schema(monkeypatch):
+    monkeypatch.setattr(codegen, "_functions", {})
+    generated = []
+    generate_source = codegen.generate_source
+    monkeypatch.setattr(codegen, "generate_source", lambda *args: generated.append(args) or generate_source(*args))
+    first = codegen.load_functions((1, 60, 3600), (60, 60, 0))
+    assert codegen.load_functions((1, 60, 3600), (60, 60, 0)) is first
+    assert len(generated) == 1
+    assert first[0](3661) == (1, 1, 1)
+
+
+def test_dynamic_classes_pick_up_schema_changes():
+    units = RTSTimeUnits.construct_from_dict(
+        {"units": {"a": {"length": 1, "wrap": 2}}, "epoch": 0, "seconds_ratio": 1, "name": "Dyn"}
+    )
+    assert codegen.decomposer(units)(3) == (1,)
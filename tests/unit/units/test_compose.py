@@ -0,0 +1,41 @@
+import pytest
+
+from rtsdatetime.array import RTSDateTimeArray
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.model import RTSDateTime, TimeComponent, Timestamp
+
+np = pytest.importorskip("numpy")
+
+
+class Event(RTSDateTime):
+    start = Timestamp()
+    clock = TimeComponent(RSTUnits, start)
+
+
+def test_compose_matches_scalar_construction():
+    columns = {"day": [7012, 0, 3], "octa": [3, 5, 0], "hexa": [2, 7, 1], "tap": [0, 5, 4], "beat": [39, 0, 12]}
+    timestamps = RSTUnits.compose(**columns)
+    assert timestamps.dtype == np.float64
+    for row, timestamp in enumerate(timestamps):
+        expected = RSTUnits(**{name: values[row] for name, values in columns.items()}).to_utc_timestamp()
+        assert timestamp == pytest.approx(expected)
+
+
+def test_compose_feeds_datetime_construction():
+    timestamps = RSTUnits.compose(day=np.array([10, 11]), octa=np.array([1, 2]))
+    records = RTSDateTimeArray(Event, {"start": timestamps})
+    assert list(records.units("clock")["octa"].visual_unit) == [1, 2]
+    assert Event(start=timestamps[1].item()).clock.day.visual_unit == 11
+
+
+def test_compose_validation():
+    with pytest.raises(ValueError, match="row 1"):
+        RSTUnits.compose(octa=[1, 6])
+    with pytest.raises(ValueError, match="row 0"):
+        RSTUnits.compose(beat=[-1])
+    with pytest.raises(ValueError):
+        RSTUnits.compose(day=[1, 2], octa=[1])
+    with pytest.raises(TypeError):
+        RSTUnits.compose(week=[1])
+    with pytest.raises(TypeError):
+        RSTUnits.compose()
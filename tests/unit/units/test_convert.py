@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+
+from rtsdatetime.convert import converter
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, Timestamp
+
+
+def test_scalar_matches_utc_roundtrip():
+    convert = converter(RSTUnits, StandardUnits)
+    assert converter(RSTUnits, StandardUnits) is convert
+    for timestamp in (0, 12345.5, -400):
+        expected = StandardUnits.from_utc_timestamp(RSTUnits.from_timestamp(timestamp).to_utc_timestamp())
+        assert convert(timestamp) == pytest.approx(expected.timestamp)
+        assert convert.convert(RSTUnits.from_timestamp(timestamp)).timestamp == pytest.approx(expected.timestamp)
+
+
+def test_unit_tuples():
+    convert = converter(RSTUnits, RSTStandardUnits)
+    assert convert.units({"hexa": 1, "tap": 3, "beat": 8}, ("hour", "minute", "seconds")) == (0, 45, 6)
+    assert convert.units({"beat": 4}) == (3, 0, 0, 0)
+    with pytest.raises(TypeError):
+        convert.units({"week": 1})
+    with pytest.raises(TypeError):
+        convert.units({"beat": 1}, ("week",))
+
+
+def test_batch():
+    np = pytest.importorskip("numpy")
+    convert = converter(RSTUnits, RSTStandardUnits)
+    assert list(convert.batch(np.array([0.0, 4.0, 8.0]))) == [0.0, 3.0, 6.0]
+
+
+def test_timestamp_set_from_units():
+    class Event(RTSDateTime):
+        start = Timestamp()
+
+    utc = datetime.datetime(2020, 1, 1).timestamp()
+    assert Event(start=RSTUnits.from_utc_timestamp(utc)).start == pytest.approx(utc)
+
+
+def test_converter_cache_does_not_keep_classes_alive():
+    import gc
+    import weakref
+
+    from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+    class Temporary(RTSTimeUnits):
+        tick: RTSUnit = RTSUnit(1, 0)
+        seconds_ratio = 1
+
+    assert converter(Temporary, StandardUnits) is converter(Temporary, StandardUnits)
+    assert converter(StandardUnits, Temporary).convert(StandardUnits.from_timestamp(2)).timestamp == 2
+    reference = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,27 @@
+import pytest
+
+from rtsdatetime.default_units import RSTStandardUnits, RSTUnits, StandardUnits
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("units", [RSTUnits, RSTStandardUnits, StandardUnits])
+def test_decompose_matches_generated_units(units):
+    epoch = units._schema.epoch_timestamp
+    timestamps = np.concatenate(
+        [
+            epoch + np.linspace(-5e8, 5e8, 257),
+            epoch + np.array([-1.5, -1.0, -0.25, 0.0, 0.25, 1.0, 1.5]),
+        ]
+    )
+    result = units.decompose(timestamps)
+    assert list(result) == list(units._schema.names)
+    for index, timestamp in enumerate(timestamps.tolist()):
+        for name, unit in units.from_utc_timestamp(timestamp).units.items():
+            assert result[name].absolute_unit[index] == unit.absolute_unit
+            assert result[name].visual_unit[index] == unit.visual_unit
+
+
+def test_decompose_rejects_2d():
+    with pytest.raises(ValueError):
+        RSTUnits.decompose(np.zeros((2, 2)))
@@ -1,4 +1,5 @@
 import pytest
+
 from rtsdatetime.units import GeneratedRSTUnit
 
 
@@ -64,6 +65,12 @@ def test_generated_unit_wrap():
     assert unit.absolute_unit == 1
 
 
+def test_negative_visual_unit_is_silent(capsys):
+    unit = GeneratedRSTUnit(-1, 1, 4)
+    assert unit.absolute_unit == -3
+    assert unit.visual_unit == 0
+    assert capsys.readouterr().out == ""
+
 
 def test_generated_unit_str():
     unit = GeneratedRSTUnit(0, 1, 4)
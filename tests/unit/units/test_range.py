@@ -0,0 +1,43 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+
+
+def test_range_aligns_boundaries():
+    start = RSTUnits(day=3, hexa=2, beat=5)
+    stop = RSTUnits(day=3, octa=1, hexa=1)
+    hexas = list(RSTUnits.range(start, stop, "hexa"))
+    assert [units.units.visual_unit("hexa") for units in hexas] == [3, 4, 5, 6, 7, 0]
+    assert all(units.timestamp % 2400 == 0 for units in hexas)
+    assert [units.octa.visual_unit for units in hexas][-1] == 1
+
+
+def test_range_step_and_negative():
+    assert [units.timestamp for units in RSTUnits.range(-1000, 1000, "decitap", 10)] == [-1000, -600, -200, 200, 600]
+    assert [units.timestamp for units in RSTUnits.range(80, -80, "decitap", -1)] == [80, 40, 0, -40]
+    assert list(RSTUnits.range(10, 5, "beat")) == []
+    with pytest.raises(ValueError):
+        RSTUnits.range(0, 10, "beat", 0)
+    with pytest.raises(TypeError):
+        RSTUnits.range(0, 10, "week")
+
+
+def test_range_bounds_are_unit_timestamps():
+    start = RSTUnits.from_utc_timestamp(1_700_000_000)
+    stop = RSTUnits.from_timestamp(start.timestamp + 3 * 2400)
+    assert [units.timestamp for units in RSTUnits.range(start.timestamp, stop.timestamp, "hexa")] == [
+        units.timestamp for units in RSTUnits.range(start, stop, "hexa")
+    ]
+
+
+def test_bucket_utc_timestamps():
+    np = pytest.importorskip("numpy")
+    epoch = RSTUnits._schema.epoch_timestamp
+    timestamps = epoch + np.array([0, 1, 400 * 0.75, -1, 5 * 400 * 0.75 + 1, 6 * 400 * 0.75])
+    absolute = RSTUnits.bucket_utc_timestamps(timestamps, "tap")
+    assert list(absolute.keys) == [-1, 0, 1, 5, 6]
+    assert list(absolute.counts) == [1, 2, 1, 1, 1]
+    assert list(absolute.keys[absolute.groups]) == [0, 0, 1, -1, 5, 6]
+    wrapped = RSTUnits.bucket_utc_timestamps(timestamps, "tap", wrapped=True)
+    expected = [RSTUnits.from_utc_timestamp(t).tap.visual_unit for t in timestamps]
+    assert list(wrapped.keys[wrapped.groups]) == expected
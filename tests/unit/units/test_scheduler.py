@@ -0,0 +1,147 @@
+import asyncio
+import datetime
+
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.scheduler import (
+    BoundaryScheduler,
+    next_boundary,
+    next_boundary_timestamp,
+    ticks,
+)
+from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+
+class FastUnits(RTSTimeUnits):
+    tick: RTSUnit = RTSUnit(1, 4)
+    round: RTSUnit = RTSUnit(4, 0)
+    seconds_ratio = 50
+    epoch = datetime.datetime(2005, 3, 16)
+
+
+@pytest.mark.parametrize("unit", ["beat", "tap", "hexa", "octa", "day"])
+def test_next_boundary_timestamp(unit):
+    now = 1_700_000_000.123
+    target = next_boundary_timestamp(RSTUnits, unit, now)
+    assert target > now
+    length = RSTUnits._schema.lengths[RSTUnits._schema.positions[unit]]
+    before = RSTUnits.from_utc_timestamp(now).timestamp // length
+    assert RSTUnits.from_utc_timestamp(target).timestamp // length == before + 1
+
+
+def test_next_boundary_unknown_unit():
+    with pytest.raises(ValueError):
+        next_boundary_timestamp(RSTUnits, "hour")
+
+
+def test_next_boundary_and_ticks():
+    async def main():
+        first = await next_boundary(FastUnits, "tick")
+        collected = []
+        async for units in ticks(FastUnits, "tick"):
+            collected.append(units.timestamp)
+            if len(collected) == 3:
+                break
+        return first, collected
+
+    first, collected = asyncio.run(main())
+    assert first.timestamp == int(first.timestamp)
+    assert collected == [collected[0], collected[0] + 1, collected[0] + 2]
+
+
+class FakeClock:
+    def __init__(self, loop: asyncio.AbstractEventLoop, wall: float):
+        self.monotonic = 0.0
+        self.offset = wall
+        loop.time = lambda: self.monotonic  # type: ignore[method-assign]
+
+    def wall(self) -> float:
+        return self.monotonic + self.offset
+
+    async def advance(self, seconds: float, steps: int):
+        for _ in range(steps):
+            self.monotonic += seconds / steps
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+
+def _run_with_fake_clock(body):
+    async def main():
+        loop = asyncio.get_running_loop()
+        clock = FakeClock(loop, 1_700_000_000.0)
+        scheduler = BoundaryScheduler(wall_clock=clock.wall)
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0)
+        try:
+            return await body(scheduler, clock)
+        finally:
+            scheduler.stop()
+            await runner
+
+    return asyncio.run(main())
+
+
+def test_scheduler_multiplexes_callbacks():
+    async def body(scheduler, clock):
+        ticks_seen: list[float] = []
+        rounds_seen: list[float] = []
+        async_seen: list[float] = []
+
+        async def on_round(units):
+            async_seen.append(units.timestamp)
+
+        for _ in range(100):
+            scheduler.register(FastUnits, "tick", lambda units: ticks_seen.append(units.timestamp))
+        scheduler.register(FastUnits, "round", lambda units: rounds_seen.append(units.timestamp))
+        scheduler.register(FastUnits, "round", on_round)
+        cancelled = scheduler.register(FastUnits, "tick", lambda units: ticks_seen.append(-1))
+        cancelled.cancel()
+        assert len(scheduler) == 102
+        await clock.advance(10.5 / FastUnits.seconds_ratio, 105)
+        return ticks_seen, rounds_seen, async_seen
+
+    ticks_seen, rounds_seen, async_seen = _run_with_fake_clock(body)
+    assert len(ticks_seen) == 1000
+    assert -1 not in ticks_seen
+    assert len(rounds_seen) in (2, 3) and all(timestamp % 4 == 0 for timestamp in rounds_seen)
+    assert async_seen == rounds_seen
+
+
+def test_reregistering_after_cancel_fires_once():
+    async def body(scheduler, clock):
+        fired: list[float] = []
+        scheduler.register(FastUnits, "tick", fired.append).cancel()
+        scheduler.register(FastUnits, "tick", fired.append)
+        await clock.advance(10.5 / FastUnits.seconds_ratio, 105)
+        return fired
+
+    fired = _run_with_fake_clock(body)
+    assert len(fired) == 10
+    assert len({units.timestamp for units in fired}) == 10
+
+
+def test_awaitable_callbacks_and_wall_clock_jumps():
+    errors: list[dict] = []
+
+    async def body(scheduler, clock):
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        seen: list[float] = []
+
+        def on_tick(units):
+            future = loop.create_future()
+            future.set_result(None)
+            seen.append(units.timestamp)
+            return future
+
+        scheduler.register(FastUnits, "tick", on_tick)
+        await clock.advance(1.5, 15)
+        clock.offset += 100
+        await clock.advance(1.5, 15)
+        return seen
+
+    seen = _run_with_fake_clock(body)
+    assert errors == []
+    assert len(seen) >= 2
+    assert seen[-1] - seen[0] >= 100 * FastUnits.seconds_ratio
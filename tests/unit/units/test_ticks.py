@@ -0,0 +1,85 @@
+import datetime
+
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+from rtsdatetime.ticks import RTSTicks, tick_schema
+from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+
+class HalfUnits(RTSTimeUnits):
+    half: RTSUnit = RTSUnit(0.5, 2)
+    whole: RTSUnit = RTSUnit(1, 0)
+    seconds_ratio = 1
+    tick_resolution = 2
+    epoch = datetime.datetime(2000, 1, 1)
+
+
+def test_schema_is_rational():
+    schema = tick_schema(RSTUnits)
+    assert (schema.numerator, schema.denominator) == (4, 3_000_000)
+    assert schema.unit_ticks[0] == 1
+
+
+def test_exact_decomposition_matches_float():
+    for timestamp in (1_700_000_000.0, 1_111_111_111.5, 1_000_000_000.25):
+        ticks = RTSTicks.from_utc_timestamp(RSTUnits, timestamp)
+        units = RSTUnits.from_utc_timestamp(timestamp)
+        assert ticks.visual_units() == units.units.visual_units()
+        assert ticks.to_utc_timestamp() == pytest.approx(timestamp, abs=1)
+
+
+def test_ticks_are_hashable_and_exact():
+    epoch = RSTUnits._schema.epoch_timestamp
+    first = RTSTicks.from_utc_timestamp(RSTUnits, epoch + 3)
+    second = RSTUnits.ticks_from_utc_timestamp(epoch + 3)
+    assert first == second and hash(first) == hash(second)
+    assert first.ticks == 4
+    assert first.to_utc_timestamp() == epoch + 3
+    assert RSTUnits.from_timestamp(4).to_ticks() == first
+
+
+def test_tick_resolution():
+    ticks = HalfUnits(half=1, whole=3).to_ticks()
+    assert ticks.ticks == 7
+    assert (ticks.visual_unit("half"), ticks.visual_unit("whole")) == (1, 3)
+    assert ticks.to_units().timestamp == 3.5
+
+    class Bad(RTSTimeUnits):
+        half: RTSUnit = RTSUnit(0.5, 2)
+        seconds_ratio = 1
+
+    with pytest.raises(ValueError):
+        tick_schema(Bad)
+
+
+def test_vectorized_ticks():
+    np = pytest.importorskip("numpy")
+    from rtsdatetime.ticks import decompose_ticks, ticks_from_utc, ticks_to_utc
+
+    timestamps = np.array([1_700_000_000.0, 1_111_111_111.5])
+    ticks = ticks_from_utc(RSTUnits, timestamps)
+    assert ticks.dtype == np.int64
+    assert list(ticks) == [RTSTicks.from_utc_timestamp(RSTUnits, t).ticks for t in timestamps]
+    decomposed = decompose_ticks(RSTUnits, ticks)
+    assert list(decomposed["beat"].visual_unit) == [
+        RTSTicks(RSTUnits, int(t)).visual_unit("beat") for t in ticks
+    ]
+    assert np.allclose(ticks_to_utc(RSTUnits, ticks), timestamps, atol=1)
+
+
+class OddRatioUnits(RTSTimeUnits):
+    beat: RTSUnit = RTSUnit(1, 0)
+    seconds_ratio = 0.7371931
+    epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+
+def test_vectorized_ticks_do_not_overflow():
+    np = pytest.importorskip("numpy")
+    from rtsdatetime.ticks import ticks_from_utc
+
+    timestamps = np.array([1.7e9, -1.7e9])
+    ticks = ticks_from_utc(OddRatioUnits, timestamps)
+    assert ticks.dtype == np.int64
+    assert list(ticks) == [RTSTicks.from_utc_timestamp(OddRatioUnits, t).ticks for t in timestamps]
+    assert ticks[0] == 1253228269
@@ -0,0 +1,36 @@
+import datetime
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.units import RTSTimeUnits, RTSUnit
+
+
+def test_schema_order():
+    schema = RSTUnits._schema
+    assert schema.names == ("beat", "decitap", "tap", "hexa", "octa", "rolling_octa", "day", "year", "quadrennial")
+    assert schema.lengths[:3] == (1, 40, 400)
+    assert schema.wraps[:3] == (40, 10, 6)
+    assert schema.epoch_timestamp == RSTUnits.epoch.timestamp()
+
+
+def test_schema_inherits_units():
+    class ExtendedUnits(StandardUnits):
+        fortnight: RTSUnit = RTSUnit(1209600, 0)
+
+    assert ExtendedUnits._schema.names == StandardUnits._schema.names + ("fortnight",)
+    assert list(ExtendedUnits.from_timestamp(1209600)) == list(ExtendedUnits._schema.names)
+
+
+def test_construct_from_dict_compiles_schema():
+    dyn_units = RTSTimeUnits.construct_from_dict(RSTUnits.to_dict())
+    assert dyn_units._schema.names == RSTUnits._schema.names
+    assert dyn_units._schema.epoch_timestamp == RSTUnits._schema.epoch_timestamp
+    assert str(dyn_units.from_timestamp(123456)).endswith(str(RSTUnits.from_timestamp(123456))[len("RSTUnits"):])
+
+
+def test_schema_epoch():
+    class ShiftedUnits(RTSTimeUnits):
+        second: RTSUnit = RTSUnit(1, 60)
+        seconds_ratio = 1
+        epoch = datetime.datetime(2000, 1, 1)
+
+    assert ShiftedUnits.from_utc_timestamp(ShiftedUnits.epoch.timestamp() + 61)["second"].visual_unit == 1
@@ -0,0 +1,37 @@
+import pytest
+
+from rtsdatetime.default_units import RSTUnits
+
+
+def test_view_is_lazy():
+    units = RSTUnits.from_timestamp(123456.5)
+    view = units.units
+    assert len(view) == len(RSTUnits._schema.names)
+    assert list(view) == list(RSTUnits._schema.names)
+    assert view["tap"].visual_unit == 2
+    _, cached_units, cached_visuals = units._unit_cache
+    assert list(cached_units) == ["tap"]
+    assert cached_visuals == {}
+
+
+def test_view_caches_until_timestamp_changes():
+    units = RSTUnits.from_timestamp(100)
+    first = units["beat"]
+    assert units["beat"] is first
+    units.timestamp = 101
+    assert units["beat"] is not first
+    assert units["beat"].visual_unit == 21
+
+
+def test_visual_unit_matches_generated_units():
+    for timestamp in (-123456.5, -1, 0, 1, 987654321):
+        units = RSTUnits.from_timestamp(timestamp)
+        for name, unit in units.units.items():
+            assert units.units.visual_unit(name) == unit.visual_unit
+
+
+def test_unknown_unit():
+    units = RSTUnits.from_timestamp(1)
+    assert "hour" not in units.units
+    with pytest.raises(KeyError):
+        units["hour"]
@@ -0,0 +1,61 @@
+import datetime
+import random
+import zoneinfo
+
+import pytest
+
+from rtsdatetime.default_units import RSTUnits, StandardUnits
+from rtsdatetime.model import RTSDateTime, Timestamp
+from rtsdatetime.units import RTSTimeUnits, RTSUnit, utc_timestamp
+
+
+class AwareUnits(RTSTimeUnits):
+    second: RTSUnit = RTSUnit(1, 60)
+    minute: RTSUnit = RTSUnit(60, 0)
+    seconds_ratio = 1
+    epoch = datetime.datetime(2000, 1, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+
+
+def _datetimes():
+    rng = random.Random(5)
+    zones = [
+        datetime.UTC,
+        datetime.timezone(datetime.timedelta(hours=-7, minutes=-30)),
+        datetime.timezone(datetime.timedelta(seconds=1, microseconds=5)),
+    ]
+    try:
+        zones.append(zoneinfo.ZoneInfo("Europe/Berlin"))
+    except zoneinfo.ZoneInfoNotFoundError:
+        pass
+    for _ in range(300):
+        yield datetime.datetime.fromtimestamp(rng.uniform(-1e10, 4e9), rng.choice(zones)).replace(
+            microsecond=rng.randrange(1_000_000)
+        )
+
+
+def test_matches_datetime_timestamp():
+    for dt in _datetimes():
+        assert utc_timestamp(dt) == dt.timestamp()
+    naive = datetime.datetime(2020, 5, 6, 7, 8, 9, 10)
+    assert utc_timestamp(naive) == naive.timestamp()
+    assert utc_timestamp(naive, assume_utc=True) == naive.replace(tzinfo=datetime.UTC).timestamp()
+
+
+def test_aware_epoch():
+    assert AwareUnits._schema.epoch_timestamp == datetime.datetime(2000, 1, 1, tzinfo=datetime.UTC).timestamp()
+    assert StandardUnits._schema.epoch_timestamp == 0
+    units = AwareUnits.from_datetime(datetime.datetime(2000, 1, 1, 0, 3, 5, tzinfo=datetime.UTC))
+    assert (units.minute.visual_unit, units.second.visual_unit) == (3, 5)
+
+    class Event(RTSDateTime):
+        start = Timestamp()
+
+    aware = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=5)))
+    assert Event(start=aware).start == aware.timestamp()
+
+
+def test_from_datetimes():
+    np = pytest.importorskip("numpy")
+    datetimes = list(_datetimes())[:20]
+    expected = [RSTUnits.from_datetime(dt).timestamp for dt in datetimes]
+    assert np.allclose(RSTUnits.from_datetimes(iter(datetimes)), expected)